@@ -38,7 +38,7 @@ class EditPersonCommand(BaseCommand):
         original_person_data: dict,
         new_marriages: list[Marriage],
         modified_marriages: dict[int, Marriage],
-        deleted_marriage_ids: list[int],
+        deleted_marriage_ids: set[int],
         new_events: list[Event],
         modified_events: dict[int, Event],
         deleted_event_ids: list[int],
@@ -68,7 +68,7 @@ class EditPersonCommand(BaseCommand):
         
         self.new_marriages: list[Marriage] = new_marriages
         self.modified_marriages: dict[int, Marriage] = modified_marriages
-        self.deleted_marriage_ids: list[int] = deleted_marriage_ids
+        self.deleted_marriage_ids: set[int] = deleted_marriage_ids
         
         self.new_events: list[Event] = new_events
         self.modified_events: dict[int, Event] = modified_events
@@ -101,15 +101,10 @@ class EditPersonCommand(BaseCommand):
         """Apply all marriage changes."""
         marriage_repo: MarriageRepository = MarriageRepository(self.db_manager)
         
-        for marriage_id in self.deleted_marriage_ids:
-            marriage_repo.delete(marriage_id)
-        
-        for marriage in self.new_marriages:
-            marriage_id: int = marriage_repo.insert(marriage)
-            self.inserted_marriage_ids.append(marriage_id)
-        
-        for marriage_id, marriage in self.modified_marriages.items():
-            marriage_repo.update(marriage)
+        with self.db_manager.transaction():
+            marriage_repo.delete_many(list(self.deleted_marriage_ids))
+            self.inserted_marriage_ids.extend(marriage_repo.insert_many(self.new_marriages))
+            marriage_repo.update_many(list(self.modified_marriages.values()))
     
     def _apply_event_changes(self) -> None:
         """Apply all event changes."""
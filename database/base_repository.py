@@ -162,4 +162,57 @@ class BaseRepository(ABC, Generic[T]):
         
         cursor: sqlite3.Cursor = self._get_cursor()
         cursor.execute(self._get_delete_sql(), (entity_id,))
+        self.db.mark_dirty()
+    
+    # ------------------------------------------------------------------
+    # Batch CRUD Operations
+    # ------------------------------------------------------------------
+    
+    def insert_many(self, entities: list[T]) -> list[int]:
+        """Insert entities with one prepared statement and return their IDs."""
+        if not entities:
+            return []
+        
+        self._ensure_connection()
+        
+        cursor: sqlite3.Cursor = self._get_cursor()
+        sql: str = self._get_insert_sql()
+        entity_ids: list[int] = []
+        
+        for entity in entities:
+            cursor.execute(sql, self._entity_to_values_without_id(entity))
+            entity_id: int | None = cursor.lastrowid
+            entity_ids.append(entity_id if entity_id is not None else self.DEFAULT_ID_ON_ERROR)
+        
+        self.db.mark_dirty()
+        return entity_ids
+    
+    def update_many(self, entities: list[T]) -> None:
+        """Update existing entities with a single executemany call."""
+        if not entities:
+            return
+        
+        self._ensure_connection()
+        
+        for entity in entities:
+            if entity.id is None:
+                entity_name = self._get_entity_name()
+                raise ValueError(self.ERROR_NO_ID_FOR_UPDATE.format(entity=entity_name))
+        
+        cursor: sqlite3.Cursor = self._get_cursor()
+        cursor.executemany(
+            self._get_update_sql(),
+            [self._entity_to_values_for_update(entity) for entity in entities]
+        )
+        self.db.mark_dirty()
+    
+    def delete_many(self, entity_ids: list[int]) -> None:
+        """Delete entities by ID with a single executemany call."""
+        if not entity_ids:
+            return
+        
+        self._ensure_connection()
+        
+        cursor: sqlite3.Cursor = self._get_cursor()
+        cursor.executemany(self._get_delete_sql(), [(entity_id,) for entity_id in entity_ids])
         self.db.mark_dirty()
\ No newline at end of file
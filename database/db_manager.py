@@ -5,7 +5,8 @@ from __future__ import annotations
 import sqlite3
 import shutil
 import os
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
 
 from utils.date_formatter import DateFormatter
 
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 class DatabaseManager:
     """Manages SQLite-based .dyn dynasty database files."""
 
+    SAVEPOINT_NAME: str = "dyn_batch"
+
     def __init__(self, parent: MainWindow) -> None:
         """Initialize database manager with parent window reference."""
         self.parent: MainWindow = parent
@@ -109,6 +112,33 @@ class DatabaseManager:
         """Mark the database as having no unsaved changes."""
         self._unsaved_changes = False
 
+    # ------------------------------------------------------------------
+    # Transactions
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Apply a batch of writes atomically without committing to disk.
+        
+        Changes stay in the open transaction until save_database commits,
+        so a failed batch is rolled back to a savepoint instead.
+        """
+        if self.conn is None:
+            raise RuntimeError("Cannot start transaction: no database connection")
+        
+        conn: sqlite3.Connection = self.conn
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        
+        conn.execute(f"SAVEPOINT {self.SAVEPOINT_NAME}")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute(f"ROLLBACK TO {self.SAVEPOINT_NAME}")
+            conn.execute(f"RELEASE {self.SAVEPOINT_NAME}")
+            raise
+        conn.execute(f"RELEASE {self.SAVEPOINT_NAME}")
+
     # ------------------------------------------------------------------
     # Connection Management
     # ------------------------------------------------------------------
@@ -47,6 +47,8 @@ class PersonRepository(BaseRepository[Person]):
     
     SQL_SELECT_ALL: str = "SELECT * FROM Person ORDER BY last_name, first_name"
     
+    SQL_SELECT_BY_IDS_FORMAT: str = "SELECT * FROM Person WHERE id IN ({placeholders})"
+    
     SQL_SELECT_BY_NAME: str = """
         SELECT * FROM Person 
         WHERE first_name = ? AND last_name = ?
@@ -59,6 +61,12 @@ class PersonRepository(BaseRepository[Person]):
         ORDER BY birth_year, birth_month, birth_day
     """
     
+    SQL_SELECT_CHILDREN_OF_ANY_FORMAT: str = """
+        SELECT * FROM Person 
+        WHERE father_id IN ({placeholders}) OR mother_id IN ({placeholders})
+        ORDER BY birth_year, birth_month, birth_day
+    """
+    
     SQL_SELECT_ALIVE_IN_YEAR: str = """
         SELECT * FROM Person
         WHERE birth_year <= ? 
@@ -218,6 +226,28 @@ class PersonRepository(BaseRepository[Person]):
         
         return [self._row_to_entity(row) for row in rows]
     
+    def get_many(self, person_ids: list[int]) -> dict[int, Person]:
+        """Retrieve the given people in a single query, keyed by ID."""
+        unique_ids: list[int] = list(dict.fromkeys(person_ids))
+        if not unique_ids:
+            return {}
+        
+        self._ensure_connection()
+        
+        placeholders: str = ", ".join("?" * len(unique_ids))
+        sql: str = self.SQL_SELECT_BY_IDS_FORMAT.format(placeholders=placeholders)
+        
+        cursor: sqlite3.Cursor = self._get_cursor()
+        cursor.execute(sql, unique_ids)
+        rows: list[sqlite3.Row] = cursor.fetchall()
+        
+        people: dict[int, Person] = {}
+        for row in rows:
+            person: Person = self._row_to_entity(row)
+            people[person.id] = person  # type: ignore[index]
+        
+        return people
+    
     def get_by_name(self, first_name: str, last_name: str) -> list[Person]:
         """Find people by first and last name."""
         self._ensure_connection()
@@ -238,6 +268,23 @@ class PersonRepository(BaseRepository[Person]):
         
         return [self._row_to_entity(row) for row in rows]
     
+    def get_children_of_any(self, parent_ids: list[int]) -> list[Person]:
+        """Retrieve children of any of the given parents in a single query."""
+        unique_ids: list[int] = list(dict.fromkeys(parent_ids))
+        if not unique_ids:
+            return []
+        
+        self._ensure_connection()
+        
+        placeholders: str = ", ".join("?" * len(unique_ids))
+        sql: str = self.SQL_SELECT_CHILDREN_OF_ANY_FORMAT.format(placeholders=placeholders)
+        
+        cursor: sqlite3.Cursor = self._get_cursor()
+        cursor.execute(sql, (*unique_ids, *unique_ids))
+        rows: list[sqlite3.Row] = cursor.fetchall()
+        
+        return [self._row_to_entity(row) for row in rows]
+    
     def get_alive_in_year(self, year: int) -> list[Person]:
         """Retrieve all people alive in a given year."""
         self._ensure_connection()
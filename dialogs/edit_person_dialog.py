@@ -207,8 +207,10 @@ class EditPersonDialog(QDialog):
         """Create stacked widget with all panels."""
         panel_stack: QStackedWidget = QStackedWidget()
         
-        self.general_panel: GeneralPanel = GeneralPanel(self)
-        self.relationships_panel: RelationshipsPanel = RelationshipsPanel(self.db_manager, self)
+        self.general_panel: GeneralPanel = GeneralPanel(edit_dialog=self, parent=self)
+        self.relationships_panel: RelationshipsPanel = RelationshipsPanel(
+            self.db_manager, edit_dialog=self, parent=self
+        )
         self.events_panel: EventsPanel = EventsPanel(self.db_manager, self)
         
         panel_stack.addWidget(self.general_panel)
@@ -395,9 +397,7 @@ class EditPersonDialog(QDialog):
         self.original_marriages = self._capture_marriages_state()
         self.original_events = self._capture_events_state()
         
-        self.relationships_panel.new_marriages.clear()
-        self.relationships_panel.modified_marriages.clear()
-        self.relationships_panel.deleted_marriage_ids.clear()
+        self.relationships_panel.clear_pending_marriage_changes()
         
         self.events_panel.new_events.clear()
         self.events_panel.modified_events.clear()
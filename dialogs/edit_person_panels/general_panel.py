@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QLineEdit,
-    QComboBox, QTextEdit, QLabel, QScrollArea, QCheckBox
+    QComboBox, QPlainTextEdit, QLabel, QScrollArea, QCheckBox
 )
-from PySide6.QtCore import QSignalBlocker
+from PySide6.QtCore import QEvent
 
 if TYPE_CHECKING:
+    from dialogs.edit_person_dialog import EditPersonDialog
     from models.person import Person
 
 from widgets.date_picker import DatePicker
@@ -37,13 +38,21 @@ class GeneralPanel(QWidget):
     LABEL_DYNASTY_ID: str = "Dynasty ID:"
     LABEL_EDUCATION: str = "Education:"
     LABEL_NOTES: str = "Notes:"
-    LABEL_EMPTY: str = ""
     
     # Placeholders
     PLACEHOLDER_REQUIRED: str = "Required"
     PLACEHOLDER_OPTIONAL: str = "Optional"
     PLACEHOLDER_NOTES: str = "Optional notes about this person..."
     
+    # Name Fields (label, placeholder), in form order
+    NAME_FIELDS: tuple[tuple[str, str], ...] = (
+        (LABEL_FIRST_NAME, PLACEHOLDER_REQUIRED),
+        (LABEL_MIDDLE_NAME, PLACEHOLDER_OPTIONAL),
+        (LABEL_LAST_NAME, PLACEHOLDER_REQUIRED),
+        (LABEL_MAIDEN_NAME, PLACEHOLDER_OPTIONAL),
+        (LABEL_NICKNAME, PLACEHOLDER_OPTIONAL),
+    )
+    
     # Checkboxes
     CHECKBOX_DIED: str = "Died?"
     CHECKBOX_IMMIGRANT: str = "Immigrant?"
@@ -74,17 +83,20 @@ class GeneralPanel(QWidget):
     VALIDATION_ERROR_DYNASTY_ID_POSITIVE: str = "Dynasty ID must be a positive number."
     VALIDATION_ERROR_DYNASTY_ID_INVALID: str = "Dynasty ID must be a valid number."
     
-    # Parsing Constants
-    EDUCATION_TEXT_SEPARATOR: str = " "
-    EDUCATION_LEVEL_INDEX: int = 0
-    
     # ------------------------------------------------------------------
     # Initialization
     # ------------------------------------------------------------------
     
-    def __init__(self, parent: QWidget | None = None) -> None:
-        """Initialize general panel."""
+    def __init__(
+        self,
+        edit_dialog: EditPersonDialog | None = None,
+        parent: QWidget | None = None
+    ) -> None:
+        """Initialize general panel with its owning dialog."""
         super().__init__(parent)
+        self._edit_dialog: EditPersonDialog | None = edit_dialog
+        self._parent_dialog: EditPersonDialog | None = None
+        self._loading: bool = False
         self._setup_ui()
     
     # ------------------------------------------------------------------
@@ -99,6 +111,7 @@ class GeneralPanel(QWidget):
         
         container: QWidget = QWidget()
         form: QFormLayout = QFormLayout(container)
+        form.setEnabled(False)
         
         self._create_name_fields(form)
         self._create_gender_field(form)
@@ -106,6 +119,9 @@ class GeneralPanel(QWidget):
         self._create_game_fields(form)
         self._create_notes_field(form)
         
+        form.setEnabled(True)
+        form.activate()
+        
         scroll.setWidget(container)
         
         layout: QVBoxLayout = QVBoxLayout(self)
@@ -118,41 +134,38 @@ class GeneralPanel(QWidget):
         self._update_birth_month_visibility()
     
     def _create_name_fields(self, form: QFormLayout) -> None:
-        """Create name input fields."""
-        self.first_name_input: QLineEdit = QLineEdit()
-        self.first_name_input.setPlaceholderText(self.PLACEHOLDER_REQUIRED)
-        self.first_name_input.textChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_FIRST_NAME, self.first_name_input)
-        
-        self.middle_name_input: QLineEdit = QLineEdit()
-        self.middle_name_input.setPlaceholderText(self.PLACEHOLDER_OPTIONAL)
-        self.middle_name_input.textChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_MIDDLE_NAME, self.middle_name_input)
-        
-        self.last_name_input: QLineEdit = QLineEdit()
-        self.last_name_input.setPlaceholderText(self.PLACEHOLDER_REQUIRED)
-        self.last_name_input.textChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_LAST_NAME, self.last_name_input)
-        
-        self.maiden_name_input: QLineEdit = QLineEdit()
-        self.maiden_name_input.setPlaceholderText(self.PLACEHOLDER_OPTIONAL)
-        self.maiden_name_input.textChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_MAIDEN_NAME, self.maiden_name_input)
-        
-        self.nickname_input: QLineEdit = QLineEdit()
-        self.nickname_input.setPlaceholderText(self.PLACEHOLDER_OPTIONAL)
-        self.nickname_input.textChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_NICKNAME, self.nickname_input)
+        """Create name input fields from NAME_FIELDS."""
+        mark_dirty = self._mark_dirty
+        line_edits: list[QLineEdit] = []
+        
+        for label, placeholder in self.NAME_FIELDS:
+            line_edit: QLineEdit = QLineEdit()
+            line_edit.setPlaceholderText(placeholder)
+            line_edit.textChanged.connect(mark_dirty)
+            form.addRow(label, line_edit)
+            line_edits.append(line_edit)
+        
+        first_name, middle_name, last_name, maiden_name, nickname = line_edits
+        self.first_name_input: QLineEdit = first_name
+        self.middle_name_input: QLineEdit = middle_name
+        self.last_name_input: QLineEdit = last_name
+        self.maiden_name_input: QLineEdit = maiden_name
+        self.nickname_input: QLineEdit = nickname
     
     def _create_gender_field(self, form: QFormLayout) -> None:
         """Create gender selection field."""
-        self.gender_input: QComboBox = QComboBox()
-        self.gender_input.addItems([
+        genders: tuple[str, ...] = (
             self.GENDER_UNKNOWN,
             self.GENDER_MALE,
             self.GENDER_FEMALE,
             self.GENDER_OTHER
-        ])
+        )
+        self._gender_index: dict[str, int] = {
+            gender: index for index, gender in enumerate(genders)
+        }
+        
+        self.gender_input: QComboBox = QComboBox()
+        self.gender_input.addItems(genders)
         self.gender_input.currentIndexChanged.connect(self._mark_dirty)
         form.addRow(self.LABEL_GENDER, self.gender_input)
     
@@ -163,48 +176,46 @@ class GeneralPanel(QWidget):
         self.birth_date_picker.unknown_check.setVisible(False)
         form.addRow(self.LABEL_BIRTH_DATE, self.birth_date_picker)
         
-        self._create_death_date_field(form)
-        self._create_arrival_date_field(form)
-        self._create_moved_out_date_field(form)
-    
-    def _create_death_date_field(self, form: QFormLayout) -> None:
-        """Create death date field with checkbox."""
-        self.death_date_label: QLabel = QLabel(self.LABEL_DEATH_DATE)
-        self.death_date_picker: DatePicker = DatePicker()
-        self.death_date_picker.dateChanged.connect(self._mark_dirty)
-        form.addRow(self.death_date_label, self.death_date_picker)
-        
-        self.died_check: QCheckBox = QCheckBox(self.CHECKBOX_DIED)
-        self.died_check.setChecked(False)
-        self.died_check.stateChanged.connect(self._on_died_toggled)
-        self.died_check.stateChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_EMPTY, self.died_check)
-    
-    def _create_arrival_date_field(self, form: QFormLayout) -> None:
-        """Create arrival date field with checkbox."""
-        self.arrival_date_label: QLabel = QLabel(self.LABEL_ARRIVAL_DATE)
-        self.arrival_date_picker: DatePicker = DatePicker()
-        self.arrival_date_picker.dateChanged.connect(self._mark_dirty)
-        form.addRow(self.arrival_date_label, self.arrival_date_picker)
-        
-        self.immigrant_check: QCheckBox = QCheckBox(self.CHECKBOX_IMMIGRANT)
-        self.immigrant_check.setChecked(False)
-        self.immigrant_check.stateChanged.connect(self._on_immigrant_toggled)
-        self.immigrant_check.stateChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_EMPTY, self.immigrant_check)
-    
-    def _create_moved_out_date_field(self, form: QFormLayout) -> None:
-        """Create moved out date field with checkbox."""
-        self.moved_out_date_label: QLabel = QLabel(self.LABEL_MOVED_OUT_DATE)
-        self.moved_out_date_picker: DatePicker = DatePicker()
-        self.moved_out_date_picker.dateChanged.connect(self._mark_dirty)
-        form.addRow(self.moved_out_date_label, self.moved_out_date_picker)
-        
-        self.moved_out_check: QCheckBox = QCheckBox(self.CHECKBOX_MOVED_OUT)
-        self.moved_out_check.setChecked(False)
-        self.moved_out_check.stateChanged.connect(self._on_moved_out_toggled)
-        self.moved_out_check.stateChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_EMPTY, self.moved_out_check)
+        death_label, death_picker, died_check = self._add_date_with_toggle(
+            form, self.LABEL_DEATH_DATE, self.CHECKBOX_DIED, self._on_died_toggled
+        )
+        self.death_date_label: QLabel = death_label
+        self.death_date_picker: DatePicker = death_picker
+        self.died_check: QCheckBox = died_check
+        
+        arrival_label, arrival_picker, immigrant_check = self._add_date_with_toggle(
+            form, self.LABEL_ARRIVAL_DATE, self.CHECKBOX_IMMIGRANT, self._on_immigrant_toggled
+        )
+        self.arrival_date_label: QLabel = arrival_label
+        self.arrival_date_picker: DatePicker = arrival_picker
+        self.immigrant_check: QCheckBox = immigrant_check
+        
+        moved_out_label, moved_out_picker, moved_out_check = self._add_date_with_toggle(
+            form, self.LABEL_MOVED_OUT_DATE, self.CHECKBOX_MOVED_OUT, self._on_moved_out_toggled
+        )
+        self.moved_out_date_label: QLabel = moved_out_label
+        self.moved_out_date_picker: DatePicker = moved_out_picker
+        self.moved_out_check: QCheckBox = moved_out_check
+    
+    def _add_date_with_toggle(
+        self,
+        form: QFormLayout,
+        label_text: str,
+        check_text: str,
+        on_toggled: Callable[[], None]
+    ) -> tuple[QLabel, DatePicker, QCheckBox]:
+        """Add a labelled date picker row followed by its toggle checkbox."""
+        label: QLabel = QLabel(label_text)
+        picker: DatePicker = DatePicker()
+        picker.dateChanged.connect(self._mark_dirty)
+        form.addRow(label, picker)
+        
+        check: QCheckBox = QCheckBox(check_text)
+        check.setChecked(False)
+        check.stateChanged.connect(on_toggled)
+        form.addRow(check)
+        
+        return label, picker, check
     
     def _create_game_fields(self, form: QFormLayout) -> None:
         """Create game-specific fields."""
@@ -215,23 +226,24 @@ class GeneralPanel(QWidget):
         
         self.is_founder_check: QCheckBox = QCheckBox(self.CHECKBOX_IS_FOUNDER)
         self.is_founder_check.stateChanged.connect(self._mark_dirty)
-        form.addRow(self.LABEL_EMPTY, self.is_founder_check)
+        form.addRow(self.is_founder_check)
         
         self.education_input: QComboBox = QComboBox()
-        self.education_input.addItems([
+        for level, text in enumerate((
             self.EDUCATION_LEVEL_0,
             self.EDUCATION_LEVEL_1,
             self.EDUCATION_LEVEL_2,
             self.EDUCATION_LEVEL_3,
             self.EDUCATION_LEVEL_4,
             self.EDUCATION_LEVEL_5
-        ])
+        )):
+            self.education_input.addItem(text, level)
         self.education_input.currentIndexChanged.connect(self._mark_dirty)
         form.addRow(self.LABEL_EDUCATION, self.education_input)
     
     def _create_notes_field(self, form: QFormLayout) -> None:
         """Create notes text field."""
-        self.notes_input: QTextEdit = QTextEdit()
+        self.notes_input: QPlainTextEdit = QPlainTextEdit()
         self.notes_input.setPlaceholderText(self.PLACEHOLDER_NOTES)
         self.notes_input.setMaximumHeight(self.NOTES_MAX_HEIGHT)
         self.notes_input.textChanged.connect(self._mark_dirty)
@@ -241,10 +253,21 @@ class GeneralPanel(QWidget):
     # Visibility Control
     # ------------------------------------------------------------------
     
+    def _on_died_toggled(self) -> None:
+        """Update death date visibility and mark dialog dirty."""
+        self._update_died_visibility()
+        self._mark_dirty()
+    
     def _on_immigrant_toggled(self) -> None:
-        """Handle immigrant checkbox toggle."""
+        """Update arrival date and birth month state and mark dialog dirty."""
         self._update_immigrant_visibility()
         self._update_birth_month_visibility()
+        self._mark_dirty()
+    
+    def _on_moved_out_toggled(self) -> None:
+        """Update moved out date visibility and mark dialog dirty."""
+        self._update_moved_out_visibility()
+        self._mark_dirty()
     
     def _update_immigrant_visibility(self) -> None:
         """Show or hide arrival date based on checkbox."""
@@ -264,20 +287,12 @@ class GeneralPanel(QWidget):
             self.birth_date_picker.month_spin.setEnabled(True)
             self.birth_date_picker.unknown_check.setChecked(False)
     
-    def _on_died_toggled(self) -> None:
-        """Handle died checkbox toggle."""
-        self._update_died_visibility()
-    
     def _update_died_visibility(self) -> None:
         """Show or hide death date based on checkbox."""
         has_died: bool = self.died_check.isChecked()
         self.death_date_label.setVisible(has_died)
         self.death_date_picker.setVisible(has_died)
     
-    def _on_moved_out_toggled(self) -> None:
-        """Handle moved out checkbox toggle."""
-        self._update_moved_out_visibility()
-    
     def _update_moved_out_visibility(self) -> None:
         """Show or hide moved out date based on checkbox."""
         is_moved_out: bool = self.moved_out_check.isChecked()
@@ -290,60 +305,60 @@ class GeneralPanel(QWidget):
     
     def _mark_dirty(self) -> None:
         """Mark parent dialog as having unsaved changes."""
+        if self._loading:
+            return
+        
         dialog = self._find_parent_dialog()
         if dialog:
             dialog.mark_dirty()
     
-    def _find_parent_dialog(self):
-        """Find the parent EditPersonDialog."""
+    def _find_parent_dialog(self) -> EditPersonDialog | None:
+        """Get the owning EditPersonDialog, walking the parent chain only if none was given."""
+        if self._edit_dialog is not None:
+            return self._edit_dialog
+        
+        if self._parent_dialog is not None:
+            return self._parent_dialog
+        
+        # Deferred: edit_person_dialog imports this module.
+        from dialogs.edit_person_dialog import EditPersonDialog
+        
         parent = self.parent()
         while parent:
-            from dialogs.edit_person_dialog import EditPersonDialog
             if isinstance(parent, EditPersonDialog):
+                self._parent_dialog = parent
                 return parent
             parent = parent.parent()
         return None
     
+    def changeEvent(self, event: QEvent) -> None:
+        """Forget the cached parent dialog when the panel is reparented."""
+        if event.type() == QEvent.Type.ParentChange:
+            self._parent_dialog = None
+        super().changeEvent(event)
+    
     # ------------------------------------------------------------------
     # Data Loading
     # ------------------------------------------------------------------
     
     def load_person(self, person: Person) -> None:
         """Load person data into form fields."""
-        blockers: list[QSignalBlocker] = self._create_signal_blockers()
-        
-        self._load_name_fields(person)
-        self._load_gender_field(person)
-        self._load_date_fields(person)
-        self._load_game_fields(person)
-        self._load_notes_field(person)
-        
-        self._update_died_visibility()
-        self._update_immigrant_visibility()
-        self._update_moved_out_visibility()
-        self._update_birth_month_visibility()
-    
-    def _create_signal_blockers(self) -> list[QSignalBlocker]:
-        """Create signal blockers for all input widgets."""
-        return [
-            QSignalBlocker(self.first_name_input),
-            QSignalBlocker(self.middle_name_input),
-            QSignalBlocker(self.last_name_input),
-            QSignalBlocker(self.maiden_name_input),
-            QSignalBlocker(self.nickname_input),
-            QSignalBlocker(self.gender_input),
-            QSignalBlocker(self.birth_date_picker),
-            QSignalBlocker(self.died_check),
-            QSignalBlocker(self.death_date_picker),
-            QSignalBlocker(self.immigrant_check),
-            QSignalBlocker(self.arrival_date_picker),
-            QSignalBlocker(self.moved_out_check),
-            QSignalBlocker(self.moved_out_date_picker),
-            QSignalBlocker(self.dynasty_id_input),
-            QSignalBlocker(self.is_founder_check),
-            QSignalBlocker(self.education_input),
-            QSignalBlocker(self.notes_input),
-        ]
+        self.setUpdatesEnabled(False)
+        self._loading = True
+        try:
+            self._load_name_fields(person)
+            self._load_gender_field(person)
+            self._load_date_fields(person)
+            self._load_game_fields(person)
+            self._load_notes_field(person)
+            
+            self._update_died_visibility()
+            self._update_immigrant_visibility()
+            self._update_moved_out_visibility()
+            self._update_birth_month_visibility()
+        finally:
+            self._loading = False
+            self.setUpdatesEnabled(True)
     
     def _load_name_fields(self, person: Person) -> None:
         """Load name field values from person."""
@@ -358,39 +373,45 @@ class GeneralPanel(QWidget):
         if not person.gender:
             return
         
-        index: int = self.gender_input.findText(person.gender)
+        index: int = self._gender_index.get(person.gender, -1)
         if index >= 0:
-            self.gender_input.setCurrentIndex(index)
+            self._set_combo_index(self.gender_input, index)
     
     def _load_date_fields(self, person: Person) -> None:
         """Load date field values from person."""
         if person.birth_year:
             self.birth_date_picker.set_date(person.birth_year, person.birth_month)
         
+        self._set_checked(self.died_check, bool(person.death_year))
         if person.death_year:
-            self.died_check.setChecked(True)
             self.death_date_picker.set_date(person.death_year, person.death_month)
-        else:
-            self.died_check.setChecked(False)
         
+        self._set_checked(self.immigrant_check, bool(person.arrival_year))
         if person.arrival_year:
-            self.immigrant_check.setChecked(True)
             self.arrival_date_picker.set_date(person.arrival_year, person.arrival_month)
             self.arrival_date_picker.unknown_check.setVisible(False)
-        else:
-            self.immigrant_check.setChecked(False)
         
+        self._set_checked(self.moved_out_check, bool(person.moved_out_year))
         if person.moved_out_year:
-            self.moved_out_check.setChecked(True)
             self.moved_out_date_picker.set_date(person.moved_out_year, person.moved_out_month)
-        else:
-            self.moved_out_check.setChecked(False)
     
     def _load_game_fields(self, person: Person) -> None:
         """Load game-specific field values from person."""
         self.dynasty_id_input.setText(str(person.dynasty_id))
-        self.is_founder_check.setChecked(person.is_founder)
-        self.education_input.setCurrentIndex(person.education)
+        self._set_checked(self.is_founder_check, bool(person.is_founder))
+        self._set_combo_index(self.education_input, person.education)
+    
+    @staticmethod
+    def _set_checked(check: QCheckBox, checked: bool) -> None:
+        """Set checkbox state only when it differs, avoiding a redundant signal."""
+        if check.isChecked() != checked:
+            check.setChecked(checked)
+    
+    @staticmethod
+    def _set_combo_index(combo: QComboBox, index: int) -> None:
+        """Set combo box index only when it differs, avoiding a redundant signal."""
+        if combo.currentIndex() != index:
+            combo.setCurrentIndex(index)
     
     def _load_notes_field(self, person: Person) -> None:
         """Load notes field value from person."""
@@ -408,15 +429,24 @@ class GeneralPanel(QWidget):
         arrival_year, arrival_month = self._get_arrival_date()
         moved_out_year, moved_out_month = self._get_moved_out_date()
         
+        first_name: str = self.first_name_input.text().strip()
+        middle_name: str = self.middle_name_input.text().strip()
+        last_name: str = self.last_name_input.text().strip()
+        maiden_name: str = self.maiden_name_input.text().strip()
+        nickname: str = self.nickname_input.text().strip()
+        gender: str = self.gender_input.currentText()
+        dynasty_id: int = int(self.dynasty_id_input.text() or self.DEFAULT_DYNASTY_ID)
+        is_founder: bool = self.is_founder_check.isChecked()
         education_level: int = self._parse_education_level()
+        notes: str = self.notes_input.toPlainText().strip()
         
         return {
-            'first_name': self.first_name_input.text().strip(),
-            'middle_name': self.middle_name_input.text().strip(),
-            'last_name': self.last_name_input.text().strip(),
-            'maiden_name': self.maiden_name_input.text().strip(),
-            'nickname': self.nickname_input.text().strip(),
-            'gender': self.gender_input.currentText(),
+            'first_name': first_name,
+            'middle_name': middle_name,
+            'last_name': last_name,
+            'maiden_name': maiden_name,
+            'nickname': nickname,
+            'gender': gender,
             'birth_year': birth_year,
             'birth_month': birth_month,
             'death_year': death_year,
@@ -425,10 +455,10 @@ class GeneralPanel(QWidget):
             'arrival_month': arrival_month,
             'moved_out_year': moved_out_year,
             'moved_out_month': moved_out_month,
-            'dynasty_id': int(self.dynasty_id_input.text() or self.DEFAULT_DYNASTY_ID),
-            'is_founder': self.is_founder_check.isChecked(),
+            'dynasty_id': dynasty_id,
+            'is_founder': is_founder,
             'education': education_level,
-            'notes': self.notes_input.toPlainText().strip()
+            'notes': notes
         }
     
     def _get_death_date(self) -> tuple[int | None, int | None]:
@@ -450,9 +480,8 @@ class GeneralPanel(QWidget):
         return None, None
     
     def _parse_education_level(self) -> int:
-        """Parse education level from combo box text."""
-        education_text: str = self.education_input.currentText()
-        return int(education_text.split(self.EDUCATION_TEXT_SEPARATOR)[self.EDUCATION_LEVEL_INDEX])
+        """Read education level stored as combo box item data."""
+        return int(self.education_input.currentData())
     
     # ------------------------------------------------------------------
     # Validation
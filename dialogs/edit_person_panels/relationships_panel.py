@@ -2,25 +2,33 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from bisect import bisect_right
+from contextlib import contextmanager
+from functools import partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Iterator
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, 
     QLabel, QScrollArea, QCheckBox,
     QGroupBox, QPushButton, QHBoxLayout, 
     QFrame, QMessageBox, QComboBox,
-    QDialog
+    QDialog, QStyle
 )
-from PySide6.QtCore import QSignalBlocker
+from PySide6.QtCore import QSignalBlocker, QEvent, QTimer, QStringListModel
+from PySide6.QtGui import QShowEvent
 
 if TYPE_CHECKING:
     from database.db_manager import DatabaseManager
+    from dialogs.edit_person_dialog import EditPersonDialog
     from models.person import Person
 
 from database.person_repository import PersonRepository
 from database.marriage_repository import MarriageRepository
-from widgets.person_selector import PersonSelector
+from widgets.person_selector import PersonSelector, PersonNameModel
+from widgets.person_list_view import PersonListView
 from widgets.date_picker import DatePicker
+from dialogs.create_child_dialog import CreateChildDialog
 from dialogs.create_marriage_dialog import CreateMarriageDialog
 from dialogs.end_marriage_dialog import EndMarriageDialog
 from models.marriage import Marriage
@@ -44,7 +52,6 @@ class RelationshipsPanel(QWidget):
     LABEL_MARRIED: str = "Married:"
     LABEL_ENDED: str = "Ended:"
     LABEL_REASON: str = "Reason:"
-    LABEL_EMPTY: str = ""
     
     # Button Text
     BUTTON_TEXT_VIEW_PERSON: str = "View Person"
@@ -54,6 +61,7 @@ class RelationshipsPanel(QWidget):
     BUTTON_TEXT_REACTIVATE: str = "Reactivate"
     BUTTON_TEXT_DELETE: str = "Delete"
     BUTTON_TEXT_REMOVE: str = "Remove"
+    BUTTON_TEXT_EDIT: str = "Edit"
     
     # Checkbox Text
     CHECKBOX_DATE_UNKNOWN: str = "Date Unknown"
@@ -66,6 +74,9 @@ class RelationshipsPanel(QWidget):
     PLACEHOLDER_NO_SIBLINGS: str = "No siblings found"
     PLACEHOLDER_NO_MARRIAGES: str = "No marriages recorded"
     PLACEHOLDER_NO_CHILDREN: str = "No children recorded"
+    PLACEHOLDER_LOADING_SIBLINGS: str = "Loading siblings…"
+    PLACEHOLDER_LOADING_MARRIAGES: str = "Loading marriages…"
+    PLACEHOLDER_LOADING_CHILDREN: str = "Loading children…"
     
     # Message Box Titles
     MSG_TITLE_SAVE_CHANGES: str = "Save Changes?"
@@ -95,43 +106,96 @@ class RelationshipsPanel(QWidget):
     # Person Display Format
     PERSON_DISPLAY_FORMAT: str = "{name} ({birth})"
     
+    # Marriage Summary Format
+    MARRIAGE_SUMMARY_FORMAT: str = "{date}: {spouse}"
+    MARRIAGE_SUMMARY_NO_SPOUSE: str = "No spouse selected"
+    
     # Dissolution Reasons
     REASON_DEATH: str = "Death"
     REASON_DIVORCE: str = "Divorce"
     REASON_ANNULMENT: str = "Annulment"
     REASON_OTHER: str = "Other"
     REASON_UNKNOWN: str = "Unknown"
+    REASONS: tuple[str, ...] = (
+        REASON_DEATH,
+        REASON_DIVORCE,
+        REASON_ANNULMENT,
+        REASON_OTHER,
+        REASON_UNKNOWN
+    )
+    REASON_INDEX: dict[str, int] = {reason: index for index, reason in enumerate(REASONS)}
+    
+    # Shared by every reason combo; built on first use
+    _reason_model: QStringListModel | None = None
     
     # Styles
     STYLE_PLACEHOLDER: str = "color: gray; font-style: italic; padding: 10px;"
-    STYLE_ACTIVE_STATUS: str = "font-weight: bold; color: green"
-    STYLE_ENDED_STATUS: str = "font-weight: bold; color: gray"
+    STYLE_MARRIAGE_STATUS: str = (
+        'QLabel[status="active"] { font-weight: bold; color: green }'
+        'QLabel[status="ended"] { font-weight: bold; color: gray }'
+    )
     
-    # Sorting
-    SORT_YEAR_UNKNOWN: int = 9999
-    SORT_MONTH_UNKNOWN: int = 12
+    # Status Property
+    STATUS_PROPERTY: str = "status"
+    STATUS_VALUE_ACTIVE: str = "active"
+    STATUS_VALUE_ENDED: str = "ended"
     
     # Layout
     INDENT_SPACING: int = 60
     
+    # Marriage Rows
+    DEFAULT_MARRIAGE_YEAR: int = 1721
+    DEFAULT_MARRIAGE_MONTH: int = 1
+    MARRIAGE_FRAME_POOL_SIZE: int = 8
+    
+    # Refresh Sections
+    REFRESH_SIBLINGS: str = "siblings"
+    REFRESH_MARRIAGES: str = "marriages"
+    REFRESH_CHILDREN: str = "children"
+    
     # ------------------------------------------------------------------
     # Initialization
     # ------------------------------------------------------------------
     
-    def __init__(self, db_manager: DatabaseManager, parent: QWidget | None = None) -> None:
-        """Initialize relationships panel with database manager."""
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        edit_dialog: EditPersonDialog | None = None,
+        parent: QWidget | None = None
+    ) -> None:
+        """Initialize relationships panel with database manager and owning dialog."""
         super().__init__(parent)
         
         self.db_manager: DatabaseManager = db_manager
+        self._edit_dialog: EditPersonDialog | None = edit_dialog
         self.person_repo: PersonRepository = PersonRepository(db_manager)
         self.marriage_repo: MarriageRepository = MarriageRepository(db_manager)
         self.current_person: Person | None = None
         
         self.marriage_widgets: list[tuple[Marriage, QFrame]] = []
+        self._marriage_frames: dict[int, QFrame] = {}
+        self._marriage_frame_pool: list[QFrame] = []
+        self._has_ended_marriages: bool = False
+        self._active_marriage_count: int = 0
         self.new_marriages: list[Marriage] = []
-        self.deleted_marriage_ids: list[int] = []
+        self._new_marriage_ids: set[int] = set()
+        self.deleted_marriage_ids: set[int] = set()
         self.modified_marriages: dict[int, Marriage] = {}
         
+        self._children_cache: dict[int, list[Person]] = {}
+        self._stored_marriages: list[Marriage] | None = None
+        self._people_cache: list[Person] | None = None
+        self._person_cache: dict[int, Person] = {}
+        self._spouse_name_model: PersonNameModel | None = None
+        self._parent_dialog: EditPersonDialog | None = None
+        self._updates_suspended: int = 0
+        self._last_father_id: int | None = None
+        self._last_mother_id: int | None = None
+        self._refresh_pending: set[str] = set()
+        self._refresh_scheduled: bool = False
+        self._sections_loaded: bool = False
+        self._confirm_msg: QMessageBox | None = None
+        
         self._setup_ui()
     
     # ------------------------------------------------------------------
@@ -157,6 +221,8 @@ class RelationshipsPanel(QWidget):
         main_layout: QVBoxLayout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll)
+        
+        self.setStyleSheet(self.STYLE_MARRIAGE_STATUS)
     
     def _create_parents_section(self) -> QGroupBox:
         """Create parents section with father/mother selectors."""
@@ -172,25 +238,35 @@ class RelationshipsPanel(QWidget):
         siblings_label: QLabel = QLabel(self.LABEL_SIBLINGS)
         layout.addWidget(siblings_label)
         
-        self.siblings_container: QVBoxLayout = QVBoxLayout()
-        layout.addLayout(self.siblings_container)
+        self.siblings_view: PersonListView = PersonListView(
+            self._format_person_info, self.BUTTON_TEXT_VIEW_PERSON
+        )
+        self.siblings_view.viewRequested.connect(self._jump_to_person)
+        self.siblings_view.setVisible(False)
+        layout.addWidget(self.siblings_view)
+        
+        self.siblings_placeholder: QLabel = self._create_placeholder(self.PLACEHOLDER_NO_SIBLINGS)
+        layout.addWidget(self.siblings_placeholder)
         
         return group
     
     def _create_father_row(self, form: QFormLayout) -> None:
         """Create father selector row."""
-        self.father_selector: PersonSelector = PersonSelector(self.db_manager)
+        self.father_selector: PersonSelector = PersonSelector(
+            self.db_manager, people=self._get_people()
+        )
         self.father_selector.set_filter(gender="Male")
         self.father_selector.personSelected.connect(self._mark_dirty)
         self.father_selector.selectionCleared.connect(self._mark_dirty)
-        self.father_selector.personSelected.connect(lambda: self._load_siblings())
+        self.father_selector.personSelected.connect(self._maybe_load_siblings)
+        self.father_selector.selectionCleared.connect(self._maybe_load_siblings)
         
         father_row: QHBoxLayout = QHBoxLayout()
         father_row.addWidget(self.father_selector)
         
         self.father_jump_btn: QPushButton = QPushButton(self.BUTTON_TEXT_VIEW_PERSON)
         self.father_jump_btn.clicked.connect(
-            lambda: self._jump_to_person(self.father_selector.get_person_id())
+            partial(self._jump_to_selected, self.father_selector)
         )
         father_row.addWidget(self.father_jump_btn)
         
@@ -198,18 +274,21 @@ class RelationshipsPanel(QWidget):
     
     def _create_mother_row(self, form: QFormLayout) -> None:
         """Create mother selector row."""
-        self.mother_selector: PersonSelector = PersonSelector(self.db_manager)
+        self.mother_selector: PersonSelector = PersonSelector(
+            self.db_manager, people=self._get_people()
+        )
         self.mother_selector.set_filter(gender="Female")
         self.mother_selector.personSelected.connect(self._mark_dirty)
         self.mother_selector.selectionCleared.connect(self._mark_dirty)
-        self.mother_selector.personSelected.connect(lambda: self._load_siblings())
+        self.mother_selector.personSelected.connect(self._maybe_load_siblings)
+        self.mother_selector.selectionCleared.connect(self._maybe_load_siblings)
         
         mother_row: QHBoxLayout = QHBoxLayout()
         mother_row.addWidget(self.mother_selector)
         
         self.mother_jump_btn: QPushButton = QPushButton(self.BUTTON_TEXT_VIEW_PERSON)
         self.mother_jump_btn.clicked.connect(
-            lambda: self._jump_to_person(self.mother_selector.get_person_id())
+            partial(self._jump_to_selected, self.mother_selector)
         )
         mother_row.addWidget(self.mother_jump_btn)
         
@@ -223,6 +302,9 @@ class RelationshipsPanel(QWidget):
         self.marriages_container: QVBoxLayout = QVBoxLayout()
         layout.addLayout(self.marriages_container)
         
+        self.marriages_placeholder: QLabel = self._create_placeholder(self.PLACEHOLDER_NO_MARRIAGES)
+        layout.addWidget(self.marriages_placeholder)
+        
         add_btn: QPushButton = QPushButton(self.BUTTON_TEXT_ADD_MARRIAGE)
         add_btn.clicked.connect(self._add_marriage)
         layout.addWidget(add_btn)
@@ -234,8 +316,18 @@ class RelationshipsPanel(QWidget):
         group: QGroupBox = QGroupBox(self.LABEL_CHILDREN)
         layout: QVBoxLayout = QVBoxLayout(group)
         
-        self.children_container: QVBoxLayout = QVBoxLayout()
-        layout.addLayout(self.children_container)
+        self.children_view: PersonListView = PersonListView(
+            self._format_person_info,
+            self.BUTTON_TEXT_VIEW_PERSON,
+            remove_text=self.BUTTON_TEXT_REMOVE
+        )
+        self.children_view.viewRequested.connect(self._jump_to_person)
+        self.children_view.removeRequested.connect(self._remove_child)
+        self.children_view.setVisible(False)
+        layout.addWidget(self.children_view)
+        
+        self.children_placeholder: QLabel = self._create_placeholder(self.PLACEHOLDER_NO_CHILDREN)
+        layout.addWidget(self.children_placeholder)
         
         add_btn: QPushButton = QPushButton(self.BUTTON_TEXT_ADD_CHILD)
         add_btn.clicked.connect(self._add_child)
@@ -247,70 +339,184 @@ class RelationshipsPanel(QWidget):
     # Marriage Widget Creation
     # ------------------------------------------------------------------
     
-    def _create_marriage_widget(self, marriage: Marriage) -> QFrame:
-        """Create inline editable widget for a marriage."""
+    def _acquire_marriage_frame(self, marriage: Marriage, spouse_id: int | None) -> QFrame:
+        """Get a marriage row from the pool, or build a new one, and bind it to marriage."""
+        frame: QFrame = (
+            self._marriage_frame_pool.pop()
+            if self._marriage_frame_pool
+            else self._create_marriage_widget()
+        )
+        self._bind_marriage_frame(frame, marriage, spouse_id)
+        return frame
+    
+    def _create_marriage_widget(self) -> QFrame:
+        """Create an unbound marriage row with its header and action buttons."""
         frame: QFrame = QFrame()
         frame.setFrameShape(QFrame.Shape.StyledPanel)
         frame.setFrameShadow(QFrame.Shadow.Raised)
         main_layout: QVBoxLayout = QVBoxLayout(frame)
         
-        header_layout: QHBoxLayout = self._create_marriage_header(marriage)
-        main_layout.addLayout(header_layout)
-        
-        spouse_layout: QHBoxLayout = self._create_spouse_row(marriage, frame)
-        main_layout.addLayout(spouse_layout)
-        
-        date_unknown_layout: QHBoxLayout = self._create_date_unknown_row(marriage, frame)
-        main_layout.addLayout(date_unknown_layout)
-        
-        marriage_date_layout: QHBoxLayout = self._create_marriage_date_row(marriage, frame)
-        main_layout.addLayout(marriage_date_layout)
+        frame.expanded = False  # type: ignore[attr-defined]
+        frame.editor = None  # type: ignore[attr-defined]
+        frame.dissolution_widget = None  # type: ignore[attr-defined]
         
-        if not marriage.is_active:
-            self._add_dissolution_rows(marriage, frame, main_layout)
+        header_layout: QHBoxLayout = self._create_marriage_header(frame)
+        main_layout.addLayout(header_layout)
         
-        button_layout: QHBoxLayout = self._create_marriage_buttons(marriage)
+        button_layout: QHBoxLayout = self._create_marriage_buttons(frame)
         main_layout.addLayout(button_layout)
         
         return frame
     
-    def _create_marriage_header(self, marriage: Marriage) -> QHBoxLayout:
-        """Create marriage status header."""
-        header_layout: QHBoxLayout = QHBoxLayout()
+    def _bind_marriage_frame(self, frame: QFrame, marriage: Marriage, spouse_id: int | None) -> None:
+        """Show marriage in frame as a collapsed row."""
+        frame.marriage = marriage  # type: ignore[attr-defined]
+        frame.spouse_id = spouse_id  # type: ignore[attr-defined]
         
-        status_text: str = self.STATUS_ACTIVE if marriage.is_active else self.STATUS_ENDED
-        status_style: str = self.STYLE_ACTIVE_STATUS if marriage.is_active else self.STYLE_ENDED_STATUS
+        self._collapse_marriage_row(frame)
+        self._refresh_marriage_frame(frame)
+    
+    def _create_marriage_header(self, frame: QFrame) -> QHBoxLayout:
+        """Create marriage status header with a read-only summary and Edit button."""
+        header_layout: QHBoxLayout = QHBoxLayout()
         
-        status_indicator: QLabel = QLabel(status_text)
-        status_indicator.setStyleSheet(status_style)
+        status_indicator: QLabel = QLabel()
         header_layout.addWidget(status_indicator)
+        
+        summary_label: QLabel = QLabel()
+        header_layout.addWidget(summary_label)
         header_layout.addStretch()
         
+        edit_btn: QPushButton = QPushButton(self.BUTTON_TEXT_EDIT)
+        edit_btn.clicked.connect(partial(self._expand_marriage_row, frame))
+        header_layout.addWidget(edit_btn)
+        
+        frame.status_label = status_indicator  # type: ignore[attr-defined]
+        frame.summary_label = summary_label  # type: ignore[attr-defined]
+        frame.edit_btn = edit_btn  # type: ignore[attr-defined]
+        
         return header_layout
     
-    def _create_spouse_row(self, marriage: Marriage, frame: QFrame) -> QHBoxLayout:
-        """Create spouse selector row."""
-        spouse_layout: QHBoxLayout = QHBoxLayout()
-        spouse_layout.addWidget(QLabel(self.LABEL_SPOUSE))
+    def _format_marriage_summary(self, frame: QFrame) -> str:
+        """Format marriage date and spouse name for a collapsed row."""
+        marriage: Marriage = frame.marriage  # type: ignore[attr-defined]
+        spouse_id: int | None = frame.spouse_id  # type: ignore[attr-defined]
+        spouse: Person | None = self._get_person(spouse_id) if spouse_id else None
+        
+        return self.MARRIAGE_SUMMARY_FORMAT.format(
+            date=marriage.marriage_date_string,
+            spouse=spouse.display_name if spouse else self.MARRIAGE_SUMMARY_NO_SPOUSE
+        )
+    
+    def _expand_marriage_row(self, frame: QFrame, *_args: object) -> None:
+        """Show the spouse and date editors for a row, building them on first use."""
+        if frame.expanded:  # type: ignore[attr-defined]
+            return
         
-        spouse_selector: PersonSelector = PersonSelector(self.db_manager)
+        if frame.editor is None:  # type: ignore[attr-defined]
+            self._create_marriage_editor(frame)
         
+        self._bind_marriage_editor(frame)
+        frame.expanded = True  # type: ignore[attr-defined]
+        
+        frame.editor.setVisible(True)  # type: ignore[attr-defined]
+        frame.summary_label.setVisible(False)  # type: ignore[attr-defined]
+        frame.edit_btn.setVisible(False)  # type: ignore[attr-defined]
+    
+    def _collapse_marriage_row(self, frame: QFrame) -> None:
+        """Hide a row's editors and show its summary instead."""
+        frame.expanded = False  # type: ignore[attr-defined]
+        
+        if frame.editor is not None:  # type: ignore[attr-defined]
+            frame.editor.setVisible(False)  # type: ignore[attr-defined]
+        frame.summary_label.setVisible(True)  # type: ignore[attr-defined]
+        frame.edit_btn.setVisible(True)  # type: ignore[attr-defined]
+    
+    def _create_marriage_editor(self, frame: QFrame) -> None:
+        """Build the spouse and date editors of a row, without loading values."""
+        editor: QWidget = QWidget()
+        editor_layout: QVBoxLayout = QVBoxLayout(editor)
+        editor_layout.setContentsMargins(0, 0, 0, 0)
+        
+        spouse_layout: QHBoxLayout = self._create_spouse_row(frame)
+        editor_layout.addLayout(spouse_layout)
+        
+        date_unknown_layout: QHBoxLayout = self._create_date_unknown_row(frame)
+        editor_layout.addLayout(date_unknown_layout)
+        
+        marriage_date_layout: QHBoxLayout = self._create_marriage_date_row(frame)
+        editor_layout.addLayout(marriage_date_layout)
+        
+        frame_layout: QVBoxLayout = frame.layout()  # type: ignore[assignment]
+        frame_layout.insertWidget(frame_layout.count() - 1, editor)
+        frame.editor = editor  # type: ignore[attr-defined]
+    
+    def _bind_marriage_editor(self, frame: QFrame) -> None:
+        """Load the row's marriage into its editors without emitting change signals."""
+        marriage: Marriage = frame.marriage  # type: ignore[attr-defined]
+        
+        spouse_selector: PersonSelector = frame.spouse_selector  # type: ignore[attr-defined]
+        spouse_id: int | None = frame.spouse_id  # type: ignore[attr-defined]
+        spouse: Person | None = self._get_person(spouse_id) if spouse_id else None
         with QSignalBlocker(spouse_selector):
-            spouse_id: int | None = self._get_spouse_id_for_marriage(marriage)
-            if spouse_id:
-                spouse_selector.set_person(spouse_id)
+            spouse_selector.set_shared_model(self._get_spouse_name_model())
+            if spouse is not None:
+                spouse_selector.set_person_object(spouse)
+            else:
+                spouse_selector.clear()
+        frame.spouse_jump_btn.setEnabled(spouse_selector.get_person_id() is not None)  # type: ignore[attr-defined]
+        
+        date_known: bool = marriage.marriage_year is not None
+        date_unknown_check: QCheckBox = frame.date_unknown_check  # type: ignore[attr-defined]
+        with QSignalBlocker(date_unknown_check):
+            date_unknown_check.setChecked(not date_known)
+        
+        marriage_date: DatePicker = frame.marriage_date  # type: ignore[attr-defined]
+        with QSignalBlocker(marriage_date):
+            if marriage.marriage_year:
+                marriage_date.set_date(marriage.marriage_year, marriage.marriage_month or 1)
+            else:
+                marriage_date.set_date(self.DEFAULT_MARRIAGE_YEAR, self.DEFAULT_MARRIAGE_MONTH)
+        frame.marriage_date_label.setVisible(date_known)  # type: ignore[attr-defined]
+        marriage_date.setVisible(date_known)
+        
+        self._refresh_dissolution_rows(frame, marriage)
+    
+    def _apply_marriage_status(self, status_indicator: QLabel, is_active: bool) -> None:
+        """Set status indicator text and the property the panel stylesheet matches on."""
+        if is_active:
+            status_indicator.setText(self.STATUS_ACTIVE)
+            status: str = self.STATUS_VALUE_ACTIVE
+        else:
+            status_indicator.setText(self.STATUS_ENDED)
+            status = self.STATUS_VALUE_ENDED
+        
+        if status_indicator.property(self.STATUS_PROPERTY) == status:
+            return
+        
+        status_indicator.setProperty(self.STATUS_PROPERTY, status)
+        style: QStyle = status_indicator.style()
+        style.unpolish(status_indicator)
+        style.polish(status_indicator)
+    
+    def _create_spouse_row(self, frame: QFrame) -> QHBoxLayout:
+        """Create spouse selector row."""
+        spouse_layout: QHBoxLayout = QHBoxLayout()
+        spouse_layout.addWidget(QLabel(self.LABEL_SPOUSE))
         
-        spouse_selector.personSelected.connect(self._mark_dirty)
+        spouse_selector: PersonSelector = PersonSelector(self.db_manager, people=[])
+        spouse_selector.personSelected.connect(partial(self._on_marriage_edited, frame))
+        spouse_selector.selectionCleared.connect(partial(self._on_marriage_edited, frame))
         spouse_layout.addWidget(spouse_selector)
         
         spouse_jump_btn: QPushButton = QPushButton(self.BUTTON_TEXT_VIEW_PERSON)
-        spouse_jump_btn.setEnabled(spouse_id is not None)
-        spouse_jump_btn.clicked.connect(lambda: self._jump_to_person(spouse_selector.get_person_id()))
-        spouse_selector.personSelected.connect(lambda: spouse_jump_btn.setEnabled(True))
-        spouse_selector.selectionCleared.connect(lambda: spouse_jump_btn.setEnabled(False))
+        spouse_jump_btn.clicked.connect(partial(self._jump_to_selected, spouse_selector))
+        spouse_selector.personSelected.connect(partial(self._set_button_enabled, spouse_jump_btn, True))
+        spouse_selector.selectionCleared.connect(partial(self._set_button_enabled, spouse_jump_btn, False))
         spouse_layout.addWidget(spouse_jump_btn)
         
         frame.spouse_selector = spouse_selector  # type: ignore[attr-defined]
+        frame.spouse_jump_btn = spouse_jump_btn  # type: ignore[attr-defined]
         
         return spouse_layout
     
@@ -321,13 +527,23 @@ class RelationshipsPanel(QWidget):
         
         return self.marriage_repo.get_spouse_id(marriage, self.current_person.id)
     
-    def _create_date_unknown_row(self, marriage: Marriage, frame: QFrame) -> QHBoxLayout:
+    def _build_spouse_id_map(self, marriages: list[Marriage]) -> dict[int, int | None]:
+        """Map each marriage's row key to the current person's spouse in it."""
+        person_id: int | None = self.current_person.id if self.current_person else None
+        if not person_id:
+            return {self._marriage_key(m): None for m in marriages}
+        
+        return {
+            self._marriage_key(m): self.marriage_repo.get_spouse_id(m, person_id)
+            for m in marriages
+        }
+    
+    def _create_date_unknown_row(self, frame: QFrame) -> QHBoxLayout:
         """Create date unknown checkbox row."""
         date_unknown_layout: QHBoxLayout = QHBoxLayout()
         date_unknown_layout.addSpacing(self.INDENT_SPACING)
         
         date_unknown_check: QCheckBox = QCheckBox(self.CHECKBOX_DATE_UNKNOWN)
-        date_unknown_check.setChecked(marriage.marriage_year is None)
         date_unknown_layout.addWidget(date_unknown_check)
         date_unknown_layout.addStretch()
         
@@ -335,7 +551,7 @@ class RelationshipsPanel(QWidget):
         
         return date_unknown_layout
     
-    def _create_marriage_date_row(self, marriage: Marriage, frame: QFrame) -> QHBoxLayout:
+    def _create_marriage_date_row(self, frame: QFrame) -> QHBoxLayout:
         """Create marriage date picker row."""
         marriage_date_layout: QHBoxLayout = QHBoxLayout()
         
@@ -343,31 +559,24 @@ class RelationshipsPanel(QWidget):
         marriage_date_layout.addWidget(marriage_date_label)
         
         marriage_date: DatePicker = DatePicker()
-        with QSignalBlocker(marriage_date):
-            if marriage.marriage_year:
-                marriage_date.set_date(marriage.marriage_year, marriage.marriage_month or 1)
-            else:
-                marriage_date.set_date(1721, 1)
-        
         marriage_date.unknown_check.setVisible(False)
-        marriage_date.dateChanged.connect(self._mark_dirty)
+        marriage_date.dateChanged.connect(partial(self._on_marriage_edited, frame))
         marriage_date_layout.addWidget(marriage_date)
         marriage_date_layout.addStretch()
         
-        date_known: bool = marriage.marriage_year is not None
-        marriage_date_label.setVisible(date_known)
-        marriage_date.setVisible(date_known)
-        
         date_unknown_check: QCheckBox = frame.date_unknown_check  # type: ignore[attr-defined]
         date_unknown_check.stateChanged.connect(
-            lambda: self._toggle_marriage_date_visibility(
+            partial(
+                self._toggle_marriage_date_visibility,
                 date_unknown_check,
                 marriage_date_label,
                 marriage_date
             )
         )
+        date_unknown_check.stateChanged.connect(partial(self._on_marriage_edited, frame))
         
         frame.marriage_date = marriage_date  # type: ignore[attr-defined]
+        frame.marriage_date_label = marriage_date_label  # type: ignore[attr-defined]
         
         return marriage_date_layout
     
@@ -375,33 +584,38 @@ class RelationshipsPanel(QWidget):
         self,
         checkbox: QCheckBox,
         label: QLabel,
-        picker: DatePicker
+        picker: DatePicker,
+        *_args: object
     ) -> None:
         """Toggle marriage date visibility based on checkbox."""
         date_is_known: bool = not checkbox.isChecked()
         label.setVisible(date_is_known)
         picker.setVisible(date_is_known)
-        self._mark_dirty()
     
     def _add_dissolution_rows(self, marriage: Marriage, frame: QFrame, layout: QVBoxLayout) -> None:
-        """Add dissolution date and reason rows for ended marriages."""
-        end_date_layout: QHBoxLayout = self._create_end_date_row(marriage, frame)
-        layout.addLayout(end_date_layout)
+        """Add dissolution date and reason rows below the marriage editors."""
+        dissolution_widget: QWidget = QWidget()
+        dissolution_layout: QVBoxLayout = QVBoxLayout(dissolution_widget)
+        dissolution_layout.setContentsMargins(0, 0, 0, 0)
+        
+        end_date_layout: QHBoxLayout = self._create_end_date_row(frame)
+        dissolution_layout.addLayout(end_date_layout)
         
-        reason_layout: QHBoxLayout = self._create_reason_row(marriage, frame)
-        layout.addLayout(reason_layout)
+        reason_layout: QHBoxLayout = self._create_reason_row(frame)
+        dissolution_layout.addLayout(reason_layout)
+        
+        layout.addWidget(dissolution_widget)
+        frame.dissolution_widget = dissolution_widget  # type: ignore[attr-defined]
+        
+        self._set_dissolution_values(frame, marriage)
     
-    def _create_end_date_row(self, marriage: Marriage, frame: QFrame) -> QHBoxLayout:
+    def _create_end_date_row(self, frame: QFrame) -> QHBoxLayout:
         """Create end date picker row."""
         end_date_layout: QHBoxLayout = QHBoxLayout()
         end_date_layout.addWidget(QLabel(self.LABEL_ENDED))
         
         end_date: DatePicker = DatePicker()
-        with QSignalBlocker(end_date):
-            if marriage.dissolution_year:
-                end_date.set_date(marriage.dissolution_year, marriage.dissolution_month)
-        
-        end_date.dateChanged.connect(self._mark_dirty)
+        end_date.dateChanged.connect(partial(self._on_dissolution_edited, frame))
         end_date_layout.addWidget(end_date)
         end_date_layout.addStretch()
         
@@ -409,26 +623,14 @@ class RelationshipsPanel(QWidget):
         
         return end_date_layout
     
-    def _create_reason_row(self, marriage: Marriage, frame: QFrame) -> QHBoxLayout:
+    def _create_reason_row(self, frame: QFrame) -> QHBoxLayout:
         """Create dissolution reason combo box row."""
         reason_layout: QHBoxLayout = QHBoxLayout()
         reason_layout.addWidget(QLabel(self.LABEL_REASON))
         
         reason_combo: QComboBox = QComboBox()
-        with QSignalBlocker(reason_combo):
-            reason_combo.addItems([
-                self.REASON_DEATH,
-                self.REASON_DIVORCE,
-                self.REASON_ANNULMENT,
-                self.REASON_OTHER,
-                self.REASON_UNKNOWN
-            ])
-            if marriage.dissolution_reason:
-                index: int = reason_combo.findText(marriage.dissolution_reason)
-                if index >= 0:
-                    reason_combo.setCurrentIndex(index)
-        
-        reason_combo.currentIndexChanged.connect(self._mark_dirty)
+        reason_combo.setModel(self._get_reason_model())
+        reason_combo.currentIndexChanged.connect(partial(self._on_dissolution_edited, frame))
         reason_layout.addWidget(reason_combo)
         reason_layout.addStretch()
         
@@ -436,55 +638,109 @@ class RelationshipsPanel(QWidget):
         
         return reason_layout
     
-    def _create_marriage_buttons(self, marriage: Marriage) -> QHBoxLayout:
+    @classmethod
+    def _get_reason_model(cls) -> QStringListModel:
+        """Get the dissolution reason list shared by all reason combos."""
+        if cls._reason_model is None:
+            cls._reason_model = QStringListModel(list(cls.REASONS))
+        return cls._reason_model
+    
+    def _set_dissolution_values(self, frame: QFrame, marriage: Marriage) -> None:
+        """Show marriage dissolution date and reason in the frame's editors."""
+        end_date: DatePicker = frame.end_date  # type: ignore[attr-defined]
+        with QSignalBlocker(end_date):
+            if marriage.dissolution_year:
+                end_date.set_date(marriage.dissolution_year, marriage.dissolution_month)
+        
+        reason_combo: QComboBox = frame.reason_combo  # type: ignore[attr-defined]
+        index: int = self.REASON_INDEX.get(marriage.dissolution_reason, -1)
+        with QSignalBlocker(reason_combo):
+            reason_combo.setCurrentIndex(max(index, 0))
+    
+    def _create_marriage_buttons(self, frame: QFrame) -> QHBoxLayout:
         """Create action buttons for marriage."""
         button_layout: QHBoxLayout = QHBoxLayout()
         button_layout.addStretch()
         
-        if marriage.is_active:
-            end_btn: QPushButton = QPushButton(self.BUTTON_TEXT_END_MARRIAGE)
-            end_btn.clicked.connect(lambda: self._end_marriage(marriage))
-            button_layout.addWidget(end_btn)
-        else:
-            reactivate_btn: QPushButton = QPushButton(self.BUTTON_TEXT_REACTIVATE)
-            reactivate_btn.clicked.connect(lambda: self._reactivate_marriage(marriage))
-            button_layout.addWidget(reactivate_btn)
+        end_btn: QPushButton = QPushButton(self.BUTTON_TEXT_END_MARRIAGE)
+        end_btn.clicked.connect(partial(self._run_for_frame, self._end_marriage, frame))
+        button_layout.addWidget(end_btn)
+        
+        reactivate_btn: QPushButton = QPushButton(self.BUTTON_TEXT_REACTIVATE)
+        reactivate_btn.clicked.connect(partial(self._run_for_frame, self._reactivate_marriage, frame))
+        button_layout.addWidget(reactivate_btn)
         
         delete_btn: QPushButton = QPushButton(self.BUTTON_TEXT_DELETE)
-        delete_btn.clicked.connect(lambda: self._delete_marriage(marriage))
+        delete_btn.clicked.connect(partial(self._run_for_frame, self._delete_marriage, frame))
         button_layout.addWidget(delete_btn)
         
+        frame.end_btn = end_btn  # type: ignore[attr-defined]
+        frame.reactivate_btn = reactivate_btn  # type: ignore[attr-defined]
+        
         return button_layout
     
-    # ------------------------------------------------------------------
-    # Person Widget Creation
-    # ------------------------------------------------------------------
+    @staticmethod
+    def _run_for_frame(action: Callable[[Marriage], None], frame: QFrame, *_args: object) -> None:
+        """Apply a marriage action to the marriage a row currently shows."""
+        action(frame.marriage)  # type: ignore[attr-defined]
     
-    def _create_person_widget(self, person: Person, show_remove: bool = False) -> QFrame:
-        """Create widget displaying a person with jump button."""
-        frame: QFrame = QFrame()
-        frame.setFrameShape(QFrame.Shape.StyledPanel)
-        layout: QHBoxLayout = QHBoxLayout(frame)
+    @staticmethod
+    def _set_button_enabled(button: QPushButton, enabled: bool, *_args: object) -> None:
+        """Enable or disable button, ignoring any signal arguments."""
+        button.setEnabled(enabled)
+    
+    def _refresh_marriage_frame(self, frame: QFrame) -> None:
+        """Update an existing marriage row in place after its status changed."""
+        marriage: Marriage = frame.marriage  # type: ignore[attr-defined]
+        is_active: bool = marriage.is_active
         
-        birth_info: str = self._format_birth_info(person)
-        info_text: str = self.PERSON_DISPLAY_FORMAT.format(
-            name=person.display_name,
-            birth=birth_info
-        )
-        info_label: QLabel = QLabel(info_text)
-        layout.addWidget(info_label)
-        layout.addStretch()
+        self._apply_marriage_status(frame.status_label, is_active)  # type: ignore[attr-defined]
+        frame.summary_label.setText(self._format_marriage_summary(frame))  # type: ignore[attr-defined]
         
-        jump_btn: QPushButton = QPushButton(self.BUTTON_TEXT_VIEW_PERSON)
-        jump_btn.clicked.connect(lambda: self._jump_to_person(person.id))
-        layout.addWidget(jump_btn)
+        if frame.expanded:  # type: ignore[attr-defined]
+            self._refresh_dissolution_rows(frame, marriage)
         
-        if show_remove:
-            remove_btn: QPushButton = QPushButton(self.BUTTON_TEXT_REMOVE)
-            remove_btn.clicked.connect(lambda: self._remove_child(person))
-            layout.addWidget(remove_btn)
+        frame.end_btn.setVisible(is_active)  # type: ignore[attr-defined]
+        frame.reactivate_btn.setVisible(not is_active)  # type: ignore[attr-defined]
+        frame.state = self._marriage_state(marriage)  # type: ignore[attr-defined]
+    
+    def _refresh_dissolution_rows(self, frame: QFrame, marriage: Marriage) -> None:
+        """Show, hide or build the dissolution rows of a marriage row's editor."""
+        dissolution_widget: QWidget | None = frame.dissolution_widget  # type: ignore[attr-defined]
+        if not marriage.is_active:
+            if dissolution_widget is None:
+                self._add_dissolution_rows(marriage, frame, frame.editor.layout())  # type: ignore[attr-defined]
+            else:
+                self._set_dissolution_values(frame, marriage)
+                dissolution_widget.setVisible(True)
+        elif dissolution_widget is not None:
+            dissolution_widget.setVisible(False)
+    
+    def _refresh_marriage(self, marriage: Marriage) -> None:
+        """Refresh the row showing marriage, if it has one."""
+        frame: QFrame | None = self._marriage_frames.get(self._marriage_key(marriage))
+        if frame is None:
+            return
         
-        return frame
+        frame.marriage = marriage  # type: ignore[attr-defined]
+        self._refresh_marriage_frame(frame)
+        self._update_marriage_status_counts()
+    
+    def _update_marriage_status_counts(self) -> None:
+        """Count active and ended marriages so validate() and add can short-circuit."""
+        self._active_marriage_count = sum(1 for m, _ in self.marriage_widgets if m.is_active)
+        self._has_ended_marriages = self._active_marriage_count < len(self.marriage_widgets)
+    
+    # ------------------------------------------------------------------
+    # Person Display
+    # ------------------------------------------------------------------
+    
+    def _format_person_info(self, person: Person) -> str:
+        """Format person name and birth information for display."""
+        return self.PERSON_DISPLAY_FORMAT.format(
+            name=person.display_name,
+            birth=self._format_birth_info(person)
+        )
     
     def _format_birth_info(self, person: Person) -> str:
         """Format birth information for person display."""
@@ -492,6 +748,33 @@ class RelationshipsPanel(QWidget):
             return self.BIRTH_INFO_FORMAT.format(year=person.birth_year)
         return self.BIRTH_INFO_UNKNOWN
     
+    # ------------------------------------------------------------------
+    # Confirmation Messages
+    # ------------------------------------------------------------------
+    
+    def _confirm(
+        self,
+        title: str,
+        text: str,
+        icon: QMessageBox.Icon = QMessageBox.Icon.Question,
+        buttons: QMessageBox.StandardButton = (
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        ),
+        informative_text: str = ""
+    ) -> QMessageBox.StandardButton:
+        """Show a message in the panel's shared message box and return the button pressed."""
+        if self._confirm_msg is None:
+            self._confirm_msg = QMessageBox(self)
+        
+        msg: QMessageBox = self._confirm_msg
+        msg.setIcon(icon)
+        msg.setWindowTitle(title)
+        msg.setText(text)
+        msg.setInformativeText(informative_text)
+        msg.setStandardButtons(buttons)
+        
+        return QMessageBox.StandardButton(msg.exec())
+    
     # ------------------------------------------------------------------
     # Parent Dialog Communication
     # ------------------------------------------------------------------
@@ -502,20 +785,39 @@ class RelationshipsPanel(QWidget):
         if dialog:
             dialog.mark_dirty()
     
-    def _find_parent_dialog(self):
-        """Find the parent EditPersonDialog."""
+    def _find_parent_dialog(self) -> EditPersonDialog | None:
+        """Get the owning EditPersonDialog, walking the parent chain only if none was given."""
+        if self._edit_dialog is not None:
+            return self._edit_dialog
+        
+        if self._parent_dialog is not None:
+            return self._parent_dialog
+        
+        # Deferred: edit_person_dialog imports this module.
+        from dialogs.edit_person_dialog import EditPersonDialog
+        
         parent = self.parent()
         while parent:
-            from dialogs.edit_person_dialog import EditPersonDialog
             if isinstance(parent, EditPersonDialog):
+                self._parent_dialog = parent
                 return parent
             parent = parent.parent()
         return None
     
+    def changeEvent(self, event: QEvent) -> None:
+        """Forget the cached parent dialog when the panel is reparented."""
+        if event.type() == QEvent.Type.ParentChange:
+            self._parent_dialog = None
+        super().changeEvent(event)
+    
     # ------------------------------------------------------------------
     # Navigation
     # ------------------------------------------------------------------
     
+    def _jump_to_selected(self, selector: PersonSelector, *_args: object) -> None:
+        """Jump to the person picked in selector."""
+        self._jump_to_person(selector.get_person_id())
+    
     def _jump_to_person(self, person_id: int | None) -> None:
         """Jump to editing a different person."""
         if person_id is None:
@@ -525,7 +827,7 @@ class RelationshipsPanel(QWidget):
         if not dialog:
             return
         
-        person: Person | None = self.person_repo.get_by_id(person_id)
+        person: Person | None = self._get_person(person_id)
         if not person:
             return
         
@@ -537,18 +839,16 @@ class RelationshipsPanel(QWidget):
     
     def _confirm_save_before_jump(self, dialog) -> bool:
         """Confirm whether to save changes before jumping to another person."""
-        msg: QMessageBox = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Question)
-        msg.setWindowTitle(self.MSG_TITLE_SAVE_CHANGES)
-        msg.setText(self.MSG_TEXT_SAVE_BEFORE_JUMP)
-        msg.setStandardButtons(
-            QMessageBox.StandardButton.Save |
-            QMessageBox.StandardButton.Discard |
-            QMessageBox.StandardButton.Cancel
+        result: QMessageBox.StandardButton = self._confirm(
+            self.MSG_TITLE_SAVE_CHANGES,
+            self.MSG_TEXT_SAVE_BEFORE_JUMP,
+            buttons=(
+                QMessageBox.StandardButton.Save |
+                QMessageBox.StandardButton.Discard |
+                QMessageBox.StandardButton.Cancel
+            )
         )
         
-        result = msg.exec()
-        
         if result == QMessageBox.StandardButton.Cancel:
             return False
         
@@ -574,32 +874,32 @@ class RelationshipsPanel(QWidget):
         if not self.current_person or not self.current_person.id:
             return
         
-        if not self._validate_existing_marriages():
-            return
+        active_rows: list[tuple[Marriage, QFrame]] = self._get_active_marriages()
         
-        active_marriages: list[Marriage] = self._get_active_marriages()
+        if not self._validate_existing_marriages(active_rows):
+            return
         
-        if not active_marriages:
+        if not active_rows:
             self._open_create_marriage_dialog()
             return
         
-        result: bool | None = self._handle_active_marriage_before_new(active_marriages[0])
+        result: bool | None = self._handle_active_marriage_before_new(active_rows[0][0])
         
         if result is None:
             return
         
         self._open_create_marriage_dialog()
 
-    def _get_active_marriages(self) -> list[Marriage]:
-        """Get list of currently active marriages."""
-        return [m for m, _ in self.marriage_widgets if m.is_active]
+    def _get_active_marriages(self) -> list[tuple[Marriage, QFrame]]:
+        """Get currently active marriages with their rows."""
+        if not self._active_marriage_count:
+            return []
+        
+        return [(m, w) for m, w in self.marriage_widgets if m.is_active]
 
-    def _validate_existing_marriages(self) -> bool:
+    def _validate_existing_marriages(self, active_rows: list[tuple[Marriage, QFrame]]) -> bool:
         """Validate that all active marriages have spouses selected."""
-        for marriage, widget in self.marriage_widgets:
-            if not marriage.is_active:
-                continue
-            
+        for _marriage, widget in active_rows:
             if not self._has_spouse_selected(widget):
                 self._show_incomplete_marriage_error()
                 return False
@@ -608,15 +908,15 @@ class RelationshipsPanel(QWidget):
 
     def _has_spouse_selected(self, widget: QFrame) -> bool:
         """Check if marriage widget has a spouse selected."""
-        spouse_selector: PersonSelector = widget.spouse_selector  # type: ignore[attr-defined]
-        return spouse_selector.get_person_id() is not None
+        return widget.spouse_id is not None  # type: ignore[attr-defined]
 
     def _show_incomplete_marriage_error(self) -> None:
         """Show error message for incomplete marriage."""
-        QMessageBox.warning(
-            self,
+        self._confirm(
             self.MSG_TITLE_INCOMPLETE_MARRIAGE,
-            self.MSG_TEXT_INCOMPLETE_MARRIAGE
+            self.MSG_TEXT_INCOMPLETE_MARRIAGE,
+            icon=QMessageBox.Icon.Warning,
+            buttons=QMessageBox.StandardButton.Ok
         )
 
     def _handle_active_marriage_before_new(self, active_marriage: Marriage) -> bool | None:
@@ -640,18 +940,15 @@ class RelationshipsPanel(QWidget):
 
     def _show_active_marriage_prompt(self) -> QMessageBox.StandardButton:
         """Show prompt asking user how to handle active marriage."""
-        msg: QMessageBox = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Question)
-        msg.setWindowTitle(self.MSG_TITLE_END_CURRENT_MARRIAGE)
-        msg.setText(self.MSG_TEXT_END_BEFORE_NEW)
-        msg.setStandardButtons(
-            QMessageBox.StandardButton.Yes |
-            QMessageBox.StandardButton.No |
-            QMessageBox.StandardButton.Cancel
+        return self._confirm(
+            self.MSG_TITLE_END_CURRENT_MARRIAGE,
+            self.MSG_TEXT_END_BEFORE_NEW,
+            buttons=(
+                QMessageBox.StandardButton.Yes |
+                QMessageBox.StandardButton.No |
+                QMessageBox.StandardButton.Cancel
+            )
         )
-        
-        result: int = msg.exec()
-        return QMessageBox.StandardButton(result)
 
     def _end_marriage_with_dialog(self, active_marriage: Marriage) -> bool | None:
         """Open end marriage dialog and process result."""
@@ -674,13 +971,11 @@ class RelationshipsPanel(QWidget):
         if marriage.id:
             self.modified_marriages[marriage.id] = marriage
         
-        self._load_marriages()
+        self._refresh_marriage(marriage)
         self._mark_dirty()
 
     def _open_create_marriage_dialog(self) -> None:
         """Open dialog to create new marriage."""
-        from dialogs.create_marriage_dialog import CreateMarriageDialog
-        
         if not self.current_person:
             return
         
@@ -707,7 +1002,8 @@ class RelationshipsPanel(QWidget):
         )
         
         self.new_marriages.append(new_marriage)
-        self._load_marriages()
+        self._new_marriage_ids.add(id(new_marriage))
+        self._insert_marriage_row(new_marriage)
         self._mark_dirty()
 
     def _end_marriage(self, marriage: Marriage) -> None:
@@ -739,7 +1035,7 @@ class RelationshipsPanel(QWidget):
         if marriage.id:
             self.modified_marriages[marriage.id] = marriage
         
-        self._load_marriages()
+        self._refresh_marriage(marriage)
         self._mark_dirty()
 
     def _validate_end_date(
@@ -749,38 +1045,19 @@ class RelationshipsPanel(QWidget):
         end_month: int | None
     ) -> bool:
         """Validate that end date is after marriage date."""
-        if not marriage.marriage_year or not end_year:
-            return True
-        
-        if self._is_end_before_start(marriage, end_year, end_month):
+        if marriage.ends_before_start(end_year, end_month):
             self._show_invalid_end_date_error()
             return False
         
         return True
 
-    def _is_end_before_start(
-        self,
-        marriage: Marriage,
-        end_year: int,
-        end_month: int | None
-    ) -> bool:
-        """Check if end date is before marriage start date."""
-        if end_year < marriage.marriage_year:  # type: ignore[operator]
-            return True
-        
-        if end_year == marriage.marriage_year:
-            if marriage.marriage_month and end_month:
-                if end_month < marriage.marriage_month:
-                    return True
-        
-        return False
-
     def _show_invalid_end_date_error(self) -> None:
         """Show error for invalid end date."""
-        QMessageBox.warning(
-            self,
+        self._confirm(
             self.MSG_TITLE_INVALID_DATE,
-            self.MSG_TEXT_INVALID_END_DATE
+            self.MSG_TEXT_INVALID_END_DATE,
+            icon=QMessageBox.Icon.Warning,
+            buttons=QMessageBox.StandardButton.Ok
         )
 
     def _reactivate_marriage(self, marriage: Marriage) -> None:
@@ -790,7 +1067,7 @@ class RelationshipsPanel(QWidget):
         
         self._delete_empty_active_marriages()
         self._clear_marriage_dissolution(marriage)
-        self._load_marriages()
+        self._refresh_marriage(marriage)
         self._mark_dirty()
 
     def _clear_marriage_dissolution(self, marriage: Marriage) -> None:
@@ -805,34 +1082,31 @@ class RelationshipsPanel(QWidget):
 
     def _confirm_reactivate_marriage(self) -> bool:
         """Confirm reactivation of ended marriage."""
-        msg: QMessageBox = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Question)
-        msg.setWindowTitle(self.MSG_TITLE_REACTIVATE_MARRIAGE)
-        msg.setText(self.MSG_TEXT_REACTIVATE_MARRIAGE)
-        msg.setStandardButtons(
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        return msg.exec() == QMessageBox.StandardButton.Yes
+        return self._confirm(
+            self.MSG_TITLE_REACTIVATE_MARRIAGE,
+            self.MSG_TEXT_REACTIVATE_MARRIAGE
+        ) == QMessageBox.StandardButton.Yes
 
     def _delete_empty_active_marriages(self) -> None:
         """Delete any active marriages that have no spouse selected."""
-        for m, widget in list(self.marriage_widgets):
-            if not m.is_active:
-                continue
-            
-            if self._has_spouse_selected(widget):
-                continue
-            
+        # Collected first: _remove_marriage_widget changes marriage_widgets.
+        empty_marriages: list[Marriage] = [
+            m for m, widget in self._get_active_marriages()
+            if not self._has_spouse_selected(widget)
+        ]
+        
+        for m in empty_marriages:
             self._mark_marriage_for_deletion(m)
+            self._remove_marriage_widget(m)
 
     def _mark_marriage_for_deletion(self, marriage: Marriage) -> None:
         """Mark marriage for deletion."""
         if marriage.id:
-            self.deleted_marriage_ids.append(marriage.id)
+            self.deleted_marriage_ids.add(marriage.id)
         
-        if marriage in self.new_marriages:
-            self.new_marriages.remove(marriage)
+        if id(marriage) in self._new_marriage_ids:
+            self._new_marriage_ids.discard(id(marriage))
+            self.new_marriages[:] = [m for m in self.new_marriages if m is not marriage]
 
     def _delete_marriage(self, marriage: Marriage) -> None:
         """Delete a marriage after confirmation."""
@@ -841,26 +1115,29 @@ class RelationshipsPanel(QWidget):
         
         self._mark_marriage_for_deletion(marriage)
         self._remove_marriage_widget(marriage)
-        self._load_marriages()
         self._mark_dirty()
 
     def _remove_marriage_widget(self, marriage: Marriage) -> None:
-        """Remove marriage from widget list."""
-        self.marriage_widgets = [
-            (m, w) for m, w in self.marriage_widgets if m != marriage
-        ]
+        """Remove marriage row from the panel and widget list."""
+        frame: QFrame | None = self._marriage_frames.pop(self._marriage_key(marriage), None)
+        if frame is None:
+            return
+        
+        self._release_marriage_frame(frame)
+        index: int = next(
+            i for i, (_m, w) in enumerate(self.marriage_widgets) if w is frame
+        )
+        del self.marriage_widgets[index]
+        self.marriages_placeholder.setVisible(not self.marriage_widgets)
+        self._update_marriage_status_counts()
 
     def _confirm_delete_marriage(self) -> bool:
         """Confirm deletion of marriage."""
-        msg: QMessageBox = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        msg.setWindowTitle(self.MSG_TITLE_DELETE_MARRIAGE)
-        msg.setText(self.MSG_TEXT_DELETE_MARRIAGE)
-        msg.setStandardButtons(
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        return msg.exec() == QMessageBox.StandardButton.Yes
+        return self._confirm(
+            self.MSG_TITLE_DELETE_MARRIAGE,
+            self.MSG_TEXT_DELETE_MARRIAGE,
+            icon=QMessageBox.Icon.Warning
+        ) == QMessageBox.StandardButton.Yes
 
     # ------------------------------------------------------------------
     # Child Management
@@ -876,33 +1153,21 @@ class RelationshipsPanel(QWidget):
         self._open_create_child_dialog(parent2_id)
     
     def _find_oldest_active_marriage_spouse(self) -> int | None:
-        """Find spouse from oldest active marriage."""
-        active_marriages: list[Marriage] = self.marriage_repo.get_active_marriages(
-            self.current_person.id  # type: ignore[arg-type]
+        """Find spouse from oldest active marriage, using the panel's cached marriages."""
+        oldest_marriage: Marriage | None = next(
+            (m for m in self._get_all_marriages() if m.is_active), None
         )
         
-        if not active_marriages:
+        if oldest_marriage is None:
             return None
         
-        active_marriages.sort(key=self._get_marriage_sort_key)
-        oldest_marriage: Marriage = active_marriages[0]
-        
         return self.marriage_repo.get_spouse_id(
             oldest_marriage,
             self.current_person.id  # type: ignore[arg-type]
         )
     
-    def _get_marriage_sort_key(self, marriage: Marriage) -> tuple[int, int]:
-        """Get sort key for marriage based on date."""
-        if marriage.marriage_year is None:
-            return (self.SORT_YEAR_UNKNOWN, self.SORT_MONTH_UNKNOWN)
-        
-        return (marriage.marriage_year, marriage.marriage_month or 0)
-    
     def _open_create_child_dialog(self, parent2_id: int | None) -> None:
         """Open dialog to create child."""
-        from dialogs.create_child_dialog import CreateChildDialog
-        
         if not self.current_person:
             return
         
@@ -918,7 +1183,11 @@ class RelationshipsPanel(QWidget):
         
         created_person: Person | None = dialog.get_created_person()
         if created_person:
-            self._load_children()
+            self._clear_people_cache()
+            self._invalidate_children_cache(
+                self.current_person.id, created_person.father_id, created_person.mother_id
+            )
+            self._schedule_refresh(self.REFRESH_CHILDREN)
             self._mark_dirty()
     
     def _remove_child(self, child: Person) -> None:
@@ -929,10 +1198,11 @@ class RelationshipsPanel(QWidget):
         if not self._confirm_remove_child(child):
             return
         
+        self._invalidate_children_cache(child.father_id, child.mother_id, self.current_person.id)
         self._clear_parent_relationship(child)
         self.person_repo.update(child)
         
-        self._load_children()
+        self._schedule_refresh(self.REFRESH_CHILDREN)
         self._mark_dirty()
     
     def _confirm_remove_child(self, child: Person) -> bool:
@@ -940,19 +1210,15 @@ class RelationshipsPanel(QWidget):
         if not self.current_person:
             return False
         
-        msg: QMessageBox = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        msg.setWindowTitle(self.MSG_TITLE_REMOVE_CHILD)
-        msg.setText(self.MSG_TEXT_REMOVE_CHILD_FORMAT.format(
-            child_name=child.display_name,
-            parent_name=self.current_person.display_name
-        ))
-        msg.setInformativeText(self.MSG_TEXT_REMOVE_CHILD_INFO)
-        msg.setStandardButtons(
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        return msg.exec() == QMessageBox.StandardButton.Yes
+        return self._confirm(
+            self.MSG_TITLE_REMOVE_CHILD,
+            self.MSG_TEXT_REMOVE_CHILD_FORMAT.format(
+                child_name=child.display_name,
+                parent_name=self.current_person.display_name
+            ),
+            icon=QMessageBox.Icon.Warning,
+            informative_text=self.MSG_TEXT_REMOVE_CHILD_INFO
+        ) == QMessageBox.StandardButton.Yes
     
     def _clear_parent_relationship(self, child: Person) -> None:
         """Clear parent IDs from child."""
@@ -972,171 +1238,421 @@ class RelationshipsPanel(QWidget):
     def load_person(self, person: Person) -> None:
         """Load person relationship data."""
         self.current_person = person
+        self._sections_loaded = False
         
-        self.new_marriages.clear()
-        self.deleted_marriage_ids.clear()
-        self.modified_marriages.clear()
+        self.clear_pending_marriage_changes()
+        self._children_cache.clear()
+        self._clear_people_cache()
+        self._reset_marriage_frames()
+        self._refresh_pending.clear()
         
-        blockers: list[QSignalBlocker] = [
-            QSignalBlocker(self.father_selector),
-            QSignalBlocker(self.mother_selector),
-        ]
+        self._prefetch_people([person.father_id, person.mother_id])
         
-        self._load_parent_selectors(person)
-        self._load_siblings()
-        self._load_marriages()
-        self._load_children()
+        with self._suspend_updates(), self._parent_signals_blocked():
+            self._load_parent_selectors(person)
+        
+        if self.isVisible():
+            self._schedule_sections_load()
+    
+    def showEvent(self, event: QShowEvent) -> None:
+        """Populate the siblings, marriages and children sections on first show."""
+        self._schedule_sections_load()
+        super().showEvent(event)
+    
+    def _schedule_sections_load(self) -> None:
+        """Show loading placeholders now and fill the sections on the next event loop turn."""
+        if self._sections_loaded or self.current_person is None:
+            return
+        
+        self.siblings_view.set_people([])
+        self.siblings_placeholder.setText(self.PLACEHOLDER_LOADING_SIBLINGS)
+        self.siblings_placeholder.setVisible(True)
+        self.marriages_placeholder.setText(self.PLACEHOLDER_LOADING_MARRIAGES)
+        self.marriages_placeholder.setVisible(True)
+        self.children_view.set_people([])
+        self.children_placeholder.setText(self.PLACEHOLDER_LOADING_CHILDREN)
+        self.children_placeholder.setVisible(True)
+        
+        QTimer.singleShot(0, self._ensure_sections_loaded)
+    
+    def _ensure_sections_loaded(self) -> None:
+        """Load siblings, marriages and children for the current person if not done yet."""
+        person: Person | None = self.current_person
+        if self._sections_loaded or person is None:
+            return
+        
+        self._sections_loaded = True
+        self.siblings_placeholder.setText(self.PLACEHOLDER_NO_SIBLINGS)
+        self.marriages_placeholder.setText(self.PLACEHOLDER_NO_MARRIAGES)
+        self.children_placeholder.setText(self.PLACEHOLDER_NO_CHILDREN)
+        
+        self._prefetch_children([
+            parent_id
+            for parent_id in (
+                self.father_selector.get_person_id(),
+                self.mother_selector.get_person_id(),
+                person.id,
+            )
+            if parent_id
+        ])
+        marriages: list[Marriage] = self._get_all_marriages()
+        self._prefetch_people(list(self._build_spouse_id_map(marriages).values()))
+        
+        with self._suspend_updates():
+            self._load_siblings()
+            self._load_marriages(marriages)
+            self._load_children()
     
     def _load_parent_selectors(self, person: Person) -> None:
-        """Load father and mother selectors."""
-        if person.father_id:
-            self.father_selector.set_person(person.father_id)
-            self.father_jump_btn.setEnabled(True)
-        else:
-            self.father_selector.clear()
-            self.father_jump_btn.setEnabled(False)
+        """Load father and mother selectors from prefetched people."""
+        self._set_selector_person(self.father_selector, self.father_jump_btn, person.father_id)
+        self._set_selector_person(self.mother_selector, self.mother_jump_btn, person.mother_id)
+    
+    def _set_selector_person(
+        self,
+        selector: PersonSelector,
+        jump_btn: QPushButton,
+        person_id: int | None
+    ) -> None:
+        """Show a cached person in selector, or clear it."""
+        person: Person | None = self._get_person(person_id) if person_id else None
         
-        if person.mother_id:
-            self.mother_selector.set_person(person.mother_id)
-            self.mother_jump_btn.setEnabled(True)
+        if person is not None:
+            selector.set_person_object(person)
         else:
-            self.mother_selector.clear()
-            self.mother_jump_btn.setEnabled(False)
+            selector.clear()
+        jump_btn.setEnabled(person is not None)
+    
+    def _maybe_load_siblings(self) -> None:
+        """Reload siblings only if a parent selector now holds a different person."""
+        if (
+            self.father_selector.get_person_id() == self._last_father_id
+            and self.mother_selector.get_person_id() == self._last_mother_id
+        ):
+            return
+        
+        self._schedule_refresh(self.REFRESH_SIBLINGS)
     
     def _load_siblings(self) -> None:
         """Load and display siblings."""
-        self._clear_container(self.siblings_container)
-        
-        if not self.current_person:
-            return
+        self._last_father_id = self.father_selector.get_person_id()
+        self._last_mother_id = self.mother_selector.get_person_id()
         
-        siblings: list[Person] = self._get_siblings()
-        
-        if siblings:
-            self._display_siblings(siblings)
-        else:
-            self._show_placeholder(self.siblings_container, self.PLACEHOLDER_NO_SIBLINGS)
+        with self._suspend_updates():
+            if not self.current_person:
+                self.siblings_view.set_people([])
+                self.siblings_placeholder.setVisible(False)
+                return
+            
+            siblings: list[Person] = self._get_siblings()
+            
+            self.siblings_view.set_people(siblings)
+            self.siblings_placeholder.setVisible(not siblings)
     
     def _get_siblings(self) -> list[Person]:
         """Get list of siblings from both parents."""
         if not self.current_person or not self.current_person.id:
             return []
         
-        siblings: list[Person] = []
-        
-        self._add_siblings_from_parent(self.father_selector.get_person_id(), siblings)
-        self._add_siblings_from_parent(self.mother_selector.get_person_id(), siblings)
-        
-        return siblings
-
-    def _add_siblings_from_parent(self, parent_id: int | None, siblings: list[Person]) -> None:
-        """Add siblings from a specific parent to the siblings list."""
-        if not parent_id or not self.current_person:
-            return
+        parent_ids: list[int] = [
+            parent_id
+            for parent_id in (
+                self.father_selector.get_person_id(),
+                self.mother_selector.get_person_id(),
+            )
+            if parent_id
+        ]
+        self._prefetch_children(parent_ids)
         
-        children: list[Person] = self.person_repo.get_children(parent_id)
+        seen: set[int | None] = {self.current_person.id}
+        siblings: list[Person] = []
         
-        for child in children:
-            if self._is_valid_sibling(child, siblings):
+        for parent_id in parent_ids:
+            for child in self._children_cache[parent_id]:
+                if child.id in seen:
+                    continue
+                seen.add(child.id)
                 siblings.append(child)
-
-    def _is_valid_sibling(self, child: Person, existing_siblings: list[Person]) -> bool:
-        """Check if child is a valid sibling (not self, not already in list)."""
-        if not self.current_person:
-            return False
         
-        if child.id == self.current_person.id:
-            return False
-        
-        if child in existing_siblings:
-            return False
-        
-        return True
-    
-    def _display_siblings(self, siblings: list[Person]) -> None:
-        """Display siblings in container."""
-        for sibling in siblings:
-            sibling_widget: QFrame = self._create_person_widget(sibling)
-            self.siblings_container.addWidget(sibling_widget)
+        return siblings
     
-    def _load_marriages(self) -> None:
-        """Load and display marriages."""
-        self._clear_container(self.marriages_container)
-        self.marriage_widgets.clear()
-        
-        if not self.current_person or not self.current_person.id:
-            self._show_placeholder(self.marriages_container, self.PLACEHOLDER_NO_MARRIAGES)
-            return
-        
-        all_marriages: list[Marriage] = self._get_all_marriages()
-        
-        if all_marriages:
-            self._display_marriages(all_marriages)
-        else:
-            self._show_placeholder(self.marriages_container, self.PLACEHOLDER_NO_MARRIAGES)
+    def _load_marriages(self, all_marriages: list[Marriage] | None = None) -> None:
+        """Load and display marriages, reusing rows that are still present."""
+        with self._suspend_updates():
+            if all_marriages is None:
+                all_marriages = self._get_all_marriages()
+            
+            self._sync_marriage_frames(all_marriages)
+            self.marriages_placeholder.setVisible(not all_marriages)
     
     def _get_all_marriages(self) -> list[Marriage]:
         """Get all marriages (database + new - deleted), sorted by date."""
         if not self.current_person or self.current_person.id is None:
             return []
         
-        marriages: list[Marriage] = self.marriage_repo.get_by_person(self.current_person.id)
-        marriages = [m for m in marriages if m.id not in self.deleted_marriage_ids]
+        if self._stored_marriages is None:
+            self._stored_marriages = self.marriage_repo.get_by_person(self.current_person.id)
         
-        marriages = self._apply_marriage_modifications(marriages)
+        deleted: set[int] = self.deleted_marriage_ids
+        modified: dict[int, Marriage] = self.modified_marriages
         
-        all_marriages: list[Marriage] = marriages + self.new_marriages
-        all_marriages.sort(key=self._get_marriage_sort_key)
+        # One pass: drop deleted rows and swap in modified ones.
+        all_marriages: list[Marriage] = [
+            modified.get(m.id, m)  # type: ignore[arg-type]
+            for m in self._stored_marriages
+            if m.id not in deleted
+        ]
+        all_marriages.extend(self.new_marriages)
+        all_marriages.sort(key=attrgetter("sort_key"))
         
         return all_marriages
     
-    def _apply_marriage_modifications(self, marriages: list[Marriage]) -> list[Marriage]:
-        """Apply any modified marriage data."""
-        return [
-            self.modified_marriages[m.id] if m.id and m.id in self.modified_marriages else m
-            for m in marriages
-        ]
+    def _sync_marriage_frames(self, marriages: list[Marriage]) -> None:
+        """Update marriage rows to match marriages, creating only new ones."""
+        container: QVBoxLayout = self.marriages_container
+        wanted: set[int] = {self._marriage_key(m) for m in marriages}
+        
+        stale: dict[int, QFrame] = self._marriage_frames
+        for key in [k for k in stale if k not in wanted]:
+            self._release_marriage_frame(stale.pop(key))
+        
+        frames: dict[int, QFrame] = {}
+        rows: list[tuple[Marriage, QFrame]] = []
+        spouse_ids: dict[int, int | None] = self._build_spouse_id_map(marriages)
+        marriage_key: Callable[[Marriage], int] = self._marriage_key
+        marriage_state: Callable[[Marriage], tuple] = self._marriage_state
+        
+        for index, marriage in enumerate(marriages):
+            key: int = marriage_key(marriage)
+            frame: QFrame | None = stale.pop(key, None)
+            
+            if frame is None:
+                frame = self._acquire_marriage_frame(marriage, spouse_ids[key])
+            else:
+                frame.marriage = marriage  # type: ignore[attr-defined]
+                frame.spouse_id = spouse_ids[key]  # type: ignore[attr-defined]
+                if frame.state != marriage_state(marriage):  # type: ignore[attr-defined]
+                    self._refresh_marriage_frame(frame)
+            
+            self._place_frame(container, frame, index)
+            frames[key] = frame
+            rows.append((marriage, frame))
+        
+        self.marriage_widgets = rows
+        self._marriage_frames = frames
+        self._update_marriage_status_counts()
+    
+    def _insert_marriage_row(self, marriage: Marriage) -> None:
+        """Insert a row for marriage at its sorted position without reloading."""
+        # bisect's key= argument needs Python 3.10, so search the keys directly.
+        sort_keys: list[tuple[int, int]] = [m.sort_key for m, _frame in self.marriage_widgets]
+        index: int = bisect_right(sort_keys, marriage.sort_key)
+        
+        frame: QFrame = self._acquire_marriage_frame(
+            marriage, self._get_spouse_id_for_marriage(marriage)
+        )
+        self._place_frame(self.marriages_container, frame, index)
+        self.marriage_widgets.insert(index, (marriage, frame))
+        self._marriage_frames[self._marriage_key(marriage)] = frame
+        self.marriages_placeholder.setVisible(False)
+        if marriage.is_active:
+            self._active_marriage_count += 1
+        else:
+            self._has_ended_marriages = True
     
-    def _display_marriages(self, marriages: list[Marriage]) -> None:
-        """Display marriages in container."""
-        for marriage in marriages:
-            widget: QFrame = self._create_marriage_widget(marriage)
-            self.marriages_container.addWidget(widget)
-            self.marriage_widgets.append((marriage, widget))
+    def _reset_marriage_frames(self) -> None:
+        """Release all marriage rows; their spouse fields depend on the current person."""
+        for frame in self._marriage_frames.values():
+            self._release_marriage_frame(frame)
+        self._marriage_frames.clear()
+        self.marriage_widgets.clear()
+        self._has_ended_marriages = False
+        self._active_marriage_count = 0
+    
+    @staticmethod
+    def _marriage_key(marriage: Marriage) -> int:
+        """Key a marriage row by database id, or by identity while unsaved."""
+        return marriage.id if marriage.id is not None else -id(marriage)
+    
+    @staticmethod
+    def _marriage_state(marriage: Marriage) -> tuple:
+        """Get the marriage fields that decide how its row is laid out."""
+        # is_active is derived from dissolution_year, so it is not repeated here.
+        return (
+            marriage.dissolution_year,
+            marriage.dissolution_month,
+            marriage.dissolution_reason,
+        )
     
     def _load_children(self) -> None:
         """Load and display children."""
-        self._clear_container(self.children_container)
+        with self._suspend_updates():
+            if not self.current_person or not self.current_person.id:
+                self.children_view.set_people([])
+                self.children_placeholder.setVisible(False)
+                return
+            
+            children: list[Person] = self._get_children_cached(self.current_person.id)
+            
+            self.children_view.set_people(children)
+            self.children_placeholder.setVisible(not children)
+    
+    def _get_people(self) -> list[Person] | None:
+        """Get all people for selectors, querying the database once."""
+        if self._people_cache is None and self.db_manager.is_open:
+            self._people_cache = self.person_repo.get_all()
+            self._cache_people(self._people_cache)
+        return self._people_cache
+    
+    def _get_spouse_name_model(self) -> PersonNameModel:
+        """Get the completer model shared by every spouse selector, building it once."""
+        if self._spouse_name_model is None:
+            self._spouse_name_model = PersonSelector.build_name_model(self._get_people() or [])
+        return self._spouse_name_model
+    
+    def _get_person(self, person_id: int) -> Person | None:
+        """Look up a person, querying the database only on a cache miss."""
+        if person_id not in self._person_cache:
+            self._prefetch_people([person_id])
+        return self._person_cache.get(person_id)
+    
+    def _prefetch_people(self, person_ids: list[int | None]) -> None:
+        """Load all uncached people among person_ids with a single query."""
+        missing: list[int] = [
+            person_id for person_id in person_ids
+            if person_id is not None and person_id not in self._person_cache
+        ]
+        if missing and self.db_manager.is_open:
+            self._person_cache.update(self.person_repo.get_many(missing))
+    
+    def _cache_people(self, people: list[Person]) -> None:
+        """Remember already-loaded people so later lookups skip the database."""
+        self._person_cache.update({p.id: p for p in people if p.id is not None})
+    
+    def _clear_people_cache(self) -> None:
+        """Drop cached people so the next lookup re-queries."""
+        self._people_cache = None
+        self._person_cache.clear()
+        self._spouse_name_model = None
+    
+    def _get_children_cached(self, parent_id: int) -> list[Person]:
+        """Get children of a parent, querying the database once per parent."""
+        children: list[Person] | None = self._children_cache.get(parent_id)
+        if children is None:
+            children = self.person_repo.get_children(parent_id)
+            self._children_cache[parent_id] = children
+            self._cache_people(children)
+        return children
+    
+    def _prefetch_children(self, parent_ids: list[int]) -> None:
+        """Load children of all uncached parents with a single query."""
+        missing: list[int] = [
+            parent_id for parent_id in parent_ids if parent_id not in self._children_cache
+        ]
+        if not missing:
+            return
         
-        if not self.current_person or not self.current_person.id:
+        fresh: dict[int, list[Person]] = {parent_id: [] for parent_id in missing}
+        children: list[Person] = self.person_repo.get_children_of_any(missing)
+        self._cache_people(children)
+        
+        for child in children:
+            father_children: list[Person] | None = fresh.get(child.father_id)  # type: ignore[arg-type]
+            if father_children is not None:
+                father_children.append(child)
+            if child.mother_id == child.father_id:
+                continue
+            mother_children: list[Person] | None = fresh.get(child.mother_id)  # type: ignore[arg-type]
+            if mother_children is not None:
+                mother_children.append(child)
+        
+        self._children_cache.update(fresh)
+    
+    def _invalidate_children_cache(self, *parent_ids: int | None) -> None:
+        """Drop cached children for the given parents."""
+        for parent_id in parent_ids:
+            if parent_id is not None:
+                self._children_cache.pop(parent_id, None)
+    
+    def _schedule_refresh(self, *sections: str) -> None:
+        """Queue sections for reloading in a single pass on the next event loop turn."""
+        self._refresh_pending.update(sections)
+        if self._refresh_scheduled:
             return
         
-        children: list[Person] = self.person_repo.get_children(self.current_person.id)
+        self._refresh_scheduled = True
+        QTimer.singleShot(0, self._flush_refresh)
+    
+    def _flush_refresh(self) -> None:
+        """Reload every section queued since the last flush."""
+        pending: set[str] = self._refresh_pending
+        self._refresh_pending = set()
+        self._refresh_scheduled = False
         
-        if children:
-            self._display_children(children)
-        else:
-            self._show_placeholder(self.children_container, self.PLACEHOLDER_NO_CHILDREN)
+        if not self._sections_loaded:
+            return
+        
+        with self._suspend_updates():
+            if self.REFRESH_SIBLINGS in pending:
+                self._load_siblings()
+            if self.REFRESH_MARRIAGES in pending:
+                self._load_marriages()
+            if self.REFRESH_CHILDREN in pending:
+                self._load_children()
+    
+    @contextmanager
+    def _suspend_updates(self) -> Iterator[None]:
+        """Disable repaints until the outermost nested block exits."""
+        self._updates_suspended += 1
+        if self._updates_suspended == 1:
+            self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._updates_suspended -= 1
+            if self._updates_suspended == 0:
+                self.setUpdatesEnabled(True)
+    
+    @contextmanager
+    def _parent_signals_blocked(self) -> Iterator[None]:
+        """Block the father and mother selectors' signals until the block exits."""
+        selectors: tuple[PersonSelector, ...] = (self.father_selector, self.mother_selector)
+        for selector in selectors:
+            selector.blockSignals(True)
+        try:
+            yield
+        finally:
+            for selector in selectors:
+                selector.blockSignals(False)
+    
+    @staticmethod
+    def _place_frame(container: QVBoxLayout, frame: QFrame, index: int) -> None:
+        """Move frame to index in container, adding it if necessary."""
+        if container.indexOf(frame) == index:
+            return
+        
+        container.removeWidget(frame)
+        container.insertWidget(index, frame)
+        frame.setVisible(True)
     
-    def _display_children(self, children: list[Person]) -> None:
-        """Display children in container."""
-        for child in children:
-            child_widget: QFrame = self._create_person_widget(child, show_remove=True)
-            self.children_container.addWidget(child_widget)
-    
-    def _clear_container(self, container: QVBoxLayout) -> None:
-        """Clear all widgets from a container."""
-        while container.count():
-            item = container.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-    
-    def _show_placeholder(self, container: QVBoxLayout, text: str) -> None:
-        """Show placeholder text in container."""
+    def _release_marriage_frame(self, frame: QFrame) -> None:
+        """Take a marriage row out of the panel, keeping it for reuse if the pool has room."""
+        self.marriages_container.removeWidget(frame)
+        
+        if len(self._marriage_frame_pool) >= self.MARRIAGE_FRAME_POOL_SIZE:
+            frame.deleteLater()
+            return
+        
+        frame.setVisible(False)
+        frame.marriage = None  # type: ignore[attr-defined]
+        self._marriage_frame_pool.append(frame)
+    
+    def _create_placeholder(self, text: str) -> QLabel:
+        """Create a hidden placeholder label for an empty section."""
         placeholder: QLabel = QLabel(text)
         placeholder.setStyleSheet(self.STYLE_PLACEHOLDER)
-        container.addWidget(placeholder)
+        placeholder.setVisible(False)
+        return placeholder
     
     # ------------------------------------------------------------------
     # Data Extraction
@@ -1153,44 +1669,48 @@ class RelationshipsPanel(QWidget):
     # Data Persistence
     # ------------------------------------------------------------------
     
-    def save_marriages(self) -> None:
-        """Save all marriage changes to database."""
-        for marriage_id in self.deleted_marriage_ids:
-            self.marriage_repo.delete(marriage_id)
-        
-        for marriage in self.new_marriages:
-            self._update_marriage_from_widget(marriage)
-            self.marriage_repo.insert(marriage)
-        
-        for marriage, widget in self.marriage_widgets:
-            if marriage in self.new_marriages:
-                continue
-            
-            if marriage.id:
-                self._update_marriage_from_widget(marriage, widget)
-                self.marriage_repo.update(marriage)
-        
+    def clear_pending_marriage_changes(self) -> None:
+        """Forget pending marriage changes and reload the rows from the database."""
+        self._stored_marriages = None
         self.new_marriages.clear()
+        self._new_marriage_ids.clear()
         self.deleted_marriage_ids.clear()
         self.modified_marriages.clear()
-    
-    def _update_marriage_from_widget(self, marriage: Marriage, widget: QFrame | None = None) -> None:
-        """Update marriage object from widget values."""
-        if widget is None:
-            widget = self._find_widget_for_marriage(marriage)
         
-        if widget is None:
+        # Saved rows must pick up their database ids, or later edits to them are dropped.
+        if self._sections_loaded:
+            self._load_marriages()
+    
+    def _on_marriage_edited(self, frame: QFrame, *_args: object) -> None:
+        """Copy an edited row's spouse and date onto its marriage."""
+        marriage: Marriage | None = frame.marriage  # type: ignore[attr-defined]
+        if marriage is None or not frame.expanded:  # type: ignore[attr-defined]
             return
         
-        self._update_marriage_spouse(marriage, widget)
-        self._update_marriage_date(marriage, widget)
+        self._update_marriage_spouse(marriage, frame)
+        self._update_marriage_date(marriage, frame)
+        frame.spouse_id = self._get_spouse_id_for_marriage(marriage)  # type: ignore[attr-defined]
+        self._record_marriage_edit(marriage)
     
-    def _find_widget_for_marriage(self, marriage: Marriage) -> QFrame | None:
-        """Find widget associated with marriage."""
-        for m, w in self.marriage_widgets:
-            if m == marriage:
-                return w
-        return None
+    def _on_dissolution_edited(self, frame: QFrame, *_args: object) -> None:
+        """Copy an edited row's end date and reason onto its ended marriage."""
+        marriage: Marriage | None = frame.marriage  # type: ignore[attr-defined]
+        if marriage is None or marriage.is_active or not frame.expanded:  # type: ignore[attr-defined]
+            return
+        
+        end_date: DatePicker = frame.end_date  # type: ignore[attr-defined]
+        reason_combo: QComboBox = frame.reason_combo  # type: ignore[attr-defined]
+        marriage.dissolution_year, marriage.dissolution_month = end_date.get_date()
+        marriage.dissolution_reason = reason_combo.currentText()
+        frame.state = self._marriage_state(marriage)  # type: ignore[attr-defined]
+        self._update_marriage_status_counts()
+        self._record_marriage_edit(marriage)
+    
+    def _record_marriage_edit(self, marriage: Marriage) -> None:
+        """Queue a stored marriage for update and mark the dialog dirty."""
+        if marriage.id is not None:
+            self.modified_marriages[marriage.id] = marriage
+        self._mark_dirty()
     
     def _update_marriage_spouse(self, marriage: Marriage, widget: QFrame) -> None:
         """Update marriage spouse IDs from widget."""
@@ -1227,36 +1747,27 @@ class RelationshipsPanel(QWidget):
         if not self.current_person:
             return (True, "")
         
-        if self.father_selector.get_person_id() == self.current_person.id:
+        person_id: int | None = self.current_person.id
+        
+        if self.father_selector.get_person_id() == person_id:
             return (False, "A person cannot be their own father.")
         
-        if self.mother_selector.get_person_id() == self.current_person.id:
+        if self.mother_selector.get_person_id() == person_id:
             return (False, "A person cannot be their own mother.")
         
-        for marriage, widget in self.marriage_widgets:
-            is_valid, error_msg = self._validate_marriage_dates(marriage, widget)
+        if not self._has_ended_marriages:
+            return (True, "")
+        
+        for marriage, _widget in self.marriage_widgets:
+            is_valid, error_msg = self._validate_marriage_dates(marriage)
             if not is_valid:
                 return (False, error_msg)
         
         return (True, "")
     
-    def _validate_marriage_dates(self, marriage: Marriage, widget: QFrame) -> tuple[bool, str]:
+    def _validate_marriage_dates(self, marriage: Marriage) -> tuple[bool, str]:
         """Validate marriage date ranges."""
-        marriage_date_picker: DatePicker = widget.marriage_date  # type: ignore[attr-defined]
-        marriage_year, marriage_month = marriage_date_picker.get_date()
-        
-        if marriage.is_active:
-            return (True, "")
-        
-        if not marriage.dissolution_year or not marriage_year:
-            return (True, "")
-        
-        if marriage.dissolution_year < marriage_year:
+        if marriage.ends_before_start(marriage.dissolution_year, marriage.dissolution_month):
             return (False, "Marriage end date cannot be before start date.")
         
-        if marriage.dissolution_year == marriage_year:
-            if marriage.dissolution_month and marriage_month:
-                if marriage.dissolution_month < marriage_month:
-                    return (False, "Marriage end date cannot be before start date.")
-        
         return (True, "")
\ No newline at end of file
@@ -8,6 +8,7 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QComboBox,
     QDialogButtonBox, QWidget, QMessageBox
 )
+from PySide6.QtCore import QStringListModel
 
 if TYPE_CHECKING:
     from models.marriage import Marriage
@@ -36,6 +37,16 @@ class EndMarriageDialog(QDialog):
     REASON_ANNULMENT: str = "Annulment"
     REASON_OTHER: str = "Other"
     REASON_UNKNOWN: str = "Unknown"
+    REASONS: tuple[str, ...] = (
+        REASON_DEATH,
+        REASON_DIVORCE,
+        REASON_ANNULMENT,
+        REASON_OTHER,
+        REASON_UNKNOWN
+    )
+    
+    # Shared by every dialog's reason combo; built on first use
+    _reason_model: QStringListModel | None = None
     
     # Message Box Titles
     MSG_TITLE_VALIDATION_ERROR: str = "Validation Error"
@@ -61,6 +72,7 @@ class EndMarriageDialog(QDialog):
         self.dissolution_year: int | None = None
         self.dissolution_month: int | None = None
         self.dissolution_reason: str = ""
+        self._warn_box: QMessageBox | None = None
         
         self.setWindowTitle(self.WINDOW_TITLE)
         self.setMinimumWidth(self.WINDOW_MIN_WIDTH)
@@ -117,15 +129,16 @@ class EndMarriageDialog(QDialog):
     def _create_reason_field(self, form: QFormLayout) -> None:
         """Create dissolution reason dropdown."""
         self.reason_combo: QComboBox = QComboBox()
-        self.reason_combo.addItems([
-            self.REASON_DEATH,
-            self.REASON_DIVORCE,
-            self.REASON_ANNULMENT,
-            self.REASON_OTHER,
-            self.REASON_UNKNOWN
-        ])
+        self.reason_combo.setModel(self._get_reason_model())
         form.addRow(self.LABEL_REASON, self.reason_combo)
     
+    @classmethod
+    def _get_reason_model(cls) -> QStringListModel:
+        """Get the dissolution reason list shared by all dialogs."""
+        if cls._reason_model is None:
+            cls._reason_model = QStringListModel(list(cls.REASONS))
+        return cls._reason_model
+    
     def _create_button_box(self) -> QDialogButtonBox:
         """Create dialog button box."""
         button_box: QDialogButtonBox = QDialogButtonBox(
@@ -167,47 +180,33 @@ class EndMarriageDialog(QDialog):
     def _validate_year_exists(self, year: int | None) -> bool:
         """Validate that year is provided."""
         if not year:
-            QMessageBox.warning(
-                self,
-                self.MSG_TITLE_VALIDATION_ERROR,
-                self.MSG_TEXT_YEAR_REQUIRED
-            )
+            self._show_warning(self.MSG_TITLE_VALIDATION_ERROR, self.MSG_TEXT_YEAR_REQUIRED)
             return False
         
         return True
     
     def _validate_end_after_start(self, year: int, month: int | None) -> bool:
         """Validate end date is after marriage start date."""
-        if not self.marriage.marriage_year:
-            return True
-        
-        if year < self.marriage.marriage_year:
-            self._show_invalid_date_error()
-            return False
-        
-        if self._is_same_year_but_earlier_month(year, month):
+        if self.marriage.ends_before_start(year, month):
             self._show_invalid_date_error()
             return False
         
         return True
     
-    def _is_same_year_but_earlier_month(self, year: int, month: int | None) -> bool:
-        """Check if end date is same year but earlier month than start."""
-        if year != self.marriage.marriage_year:
-            return False
-        
-        if not self.marriage.marriage_month or not month:
-            return False
-        
-        return month < self.marriage.marriage_month
-    
     def _show_invalid_date_error(self) -> None:
         """Show error for invalid date range."""
-        QMessageBox.warning(
-            self,
-            self.MSG_TITLE_INVALID_DATE,
-            self.MSG_TEXT_END_BEFORE_START
-        )
+        self._show_warning(self.MSG_TITLE_INVALID_DATE, self.MSG_TEXT_END_BEFORE_START)
+    
+    def _show_warning(self, title: str, text: str) -> None:
+        """Show a warning in the dialog's message box, creating it on first use."""
+        if self._warn_box is None:
+            self._warn_box = QMessageBox(self)
+            self._warn_box.setIcon(QMessageBox.Icon.Warning)
+            self._warn_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        
+        self._warn_box.setWindowTitle(title)
+        self._warn_box.setText(text)
+        self._warn_box.exec()
     
     # ------------------------------------------------------------------
     # Data Collection
@@ -39,6 +39,9 @@ class Marriage:
     MONTHS_PER_YEAR: ClassVar[int] = 12
     DEFAULT_MONTH: ClassVar[int] = 1
     DEFAULT_DAY: ClassVar[int] = 1
+
+    SORT_YEAR_UNKNOWN: ClassVar[int] = 9999
+    SORT_MONTH_UNKNOWN: ClassVar[int] = 12
     
     # Database Identity
     id: int | None = None
@@ -84,6 +87,32 @@ class Marriage:
         
         return self.STATUS_ENDED
     
+    # ------------------------------------------------------------------
+    # Computed Properties - Sorting
+    # ------------------------------------------------------------------
+    
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        """Get chronological sort key; marriages with unknown dates sort last."""
+        if self.marriage_year is None:
+            return (self.SORT_YEAR_UNKNOWN, self.SORT_MONTH_UNKNOWN)
+        
+        return (self.marriage_year, self.marriage_month or 0)
+    
+    # ------------------------------------------------------------------
+    # Date Validation
+    # ------------------------------------------------------------------
+    
+    def ends_before_start(self, end_year: int | None, end_month: int | None) -> bool:
+        """Check if an end date falls before the marriage date; months count only if both are known."""
+        if not self.marriage_year or not end_year:
+            return False
+        
+        if end_month and self.marriage_month:
+            return (end_year, end_month) < (self.marriage_year, self.marriage_month)
+        
+        return end_year < self.marriage_year
+    
     # ------------------------------------------------------------------
     # Computed Properties - Date Formatting
     # ------------------------------------------------------------------
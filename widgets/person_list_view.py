@@ -0,0 +1,322 @@
+"""Lightweight list of people with painted per-row action buttons."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from PySide6.QtWidgets import (
+    QWidget, QListView, QStyledItemDelegate, QStyle,
+    QStyleOptionViewItem, QStyleOptionButton, QApplication, QAbstractItemView
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractListModel, QModelIndex, QPersistentModelIndex,
+    QEvent, QRect, QSize, QObject, QAbstractItemModel
+)
+from PySide6.QtGui import QPainter, QMouseEvent, QKeyEvent
+
+if TYPE_CHECKING:
+    from models.person import Person
+
+
+class PersonListModel(QAbstractListModel):
+    """List model holding Person objects and their display text."""
+    
+    def __init__(self, display_format: Callable[[Person], str], parent: QObject | None = None) -> None:
+        """Initialize the model with a formatter for row text."""
+        super().__init__(parent)
+        self._display_format: Callable[[Person], str] = display_format
+        self._people: list[Person] = []
+        self._texts: list[str] = []
+    
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """Return number of people (flat list, so zero under any valid parent)."""
+        if parent.isValid():
+            return 0
+        return len(self._people)
+    
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return display text for a row."""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._texts[index.row()]
+    
+    def set_people(self, people: list[Person]) -> None:
+        """Replace the listed people."""
+        self.beginResetModel()
+        self._people = list(people)
+        self._texts = [self._display_format(person) for person in self._people]
+        self.endResetModel()
+    
+    def person_at(self, row: int) -> Person | None:
+        """Get the person shown in a row."""
+        if 0 <= row < len(self._people):
+            return self._people[row]
+        return None
+
+
+class PersonRowDelegate(QStyledItemDelegate):
+    """Paints a person row with right-aligned push buttons, without child widgets."""
+    
+    # ------------------------------------------------------------------
+    # Constants
+    # ------------------------------------------------------------------
+    
+    ACTION_VIEW: str = "view"
+    ACTION_REMOVE: str = "remove"
+    
+    ROW_PADDING: int = 6
+    BUTTON_SPACING: int = 6
+    
+    # ------------------------------------------------------------------
+    # Signals
+    # ------------------------------------------------------------------
+    
+    buttonClicked: Signal = Signal(str, int)  # action, row
+    
+    # ------------------------------------------------------------------
+    # Initialization
+    # ------------------------------------------------------------------
+    
+    def __init__(
+        self,
+        view_text: str,
+        remove_text: str | None = None,
+        parent: QObject | None = None
+    ) -> None:
+        """Initialize delegate with button labels; no Remove button without remove_text."""
+        super().__init__(parent)
+        
+        self._buttons: tuple[tuple[str, str], ...] = (
+            ((self.ACTION_VIEW, view_text), (self.ACTION_REMOVE, remove_text))
+            if remove_text is not None
+            else ((self.ACTION_VIEW, view_text),)
+        )
+        self._button_sizes: dict[str, QSize] = {}
+    
+    def has_action(self, action: str) -> bool:
+        """Check whether rows paint a button for action."""
+        return any(button_action == action for button_action, _label in self._buttons)
+    
+    # ------------------------------------------------------------------
+    # Painting
+    # ------------------------------------------------------------------
+    
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex
+    ) -> None:
+        """Paint row background, person text and buttons."""
+        view_option: QStyleOptionViewItem = QStyleOptionViewItem(option)
+        self.initStyleOption(view_option, index)
+        widget: QWidget | None = view_option.widget
+        style: QStyle = widget.style() if widget else QApplication.style()
+        
+        text: str = view_option.text
+        view_option.text = ""
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, view_option, painter, widget)
+        
+        button_rects: list[tuple[str, str, QRect]] = self._button_rects(option)
+        text_right: int = button_rects[-1][2].left() if button_rects else option.rect.right()
+        text_rect: QRect = QRect(
+            option.rect.left() + self.ROW_PADDING,
+            option.rect.top(),
+            max(0, text_right - option.rect.left() - 2 * self.ROW_PADDING),
+            option.rect.height()
+        )
+        elided: str = option.fontMetrics.elidedText(
+            text, Qt.TextElideMode.ElideRight, text_rect.width()
+        )
+        painter.drawText(
+            text_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            elided
+        )
+        
+        for _action, label, rect in button_rects:
+            button_option: QStyleOptionButton = QStyleOptionButton()
+            button_option.rect = rect
+            button_option.text = label
+            button_option.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button_option, painter, widget)
+    
+    def sizeHint(
+        self,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex
+    ) -> QSize:
+        """Row height fits the taller of the text and the buttons."""
+        base: QSize = super().sizeHint(option, index)
+        button_height: int = max(
+            (self._button_size(label, option).height() for _action, label in self._buttons),
+            default=0
+        )
+        return QSize(base.width(), max(base.height(), button_height) + self.ROW_PADDING)
+    
+    # ------------------------------------------------------------------
+    # Interaction
+    # ------------------------------------------------------------------
+    
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex
+    ) -> bool:
+        """Emit buttonClicked when a painted button is released on."""
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and isinstance(event, QMouseEvent)
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            position = event.position().toPoint()
+            for action, _label, rect in self._button_rects(option):
+                if rect.contains(position):
+                    self.buttonClicked.emit(action, index.row())
+                    return True
+        
+        return super().editorEvent(event, model, option, index)
+    
+    # ------------------------------------------------------------------
+    # Geometry
+    # ------------------------------------------------------------------
+    
+    def _button_rects(self, option: QStyleOptionViewItem) -> list[tuple[str, str, QRect]]:
+        """Lay out buttons right-to-left inside the row rectangle."""
+        rects: list[tuple[str, str, QRect]] = []
+        right: int = option.rect.right() - self.ROW_PADDING
+        
+        for action, label in reversed(self._buttons):
+            size: QSize = self._button_size(label, option)
+            top: int = option.rect.top() + (option.rect.height() - size.height()) // 2
+            rect: QRect = QRect(right - size.width() + 1, top, size.width(), size.height())
+            rects.append((action, label, rect))
+            right = rect.left() - self.BUTTON_SPACING
+        
+        return rects
+    
+    def _button_size(self, label: str, option: QStyleOptionViewItem) -> QSize:
+        """Get the style's push button size for label, computed once per label."""
+        size: QSize | None = self._button_sizes.get(label)
+        if size is not None:
+            return size
+        
+        widget: QWidget | None = option.widget
+        style: QStyle = widget.style() if widget else QApplication.style()
+        
+        button_option: QStyleOptionButton = QStyleOptionButton()
+        button_option.text = label
+        button_option.fontMetrics = option.fontMetrics
+        text_size: QSize = option.fontMetrics.size(Qt.TextFlag.TextShowMnemonic, label)
+        
+        size = style.sizeFromContents(
+            QStyle.ContentsType.CT_PushButton, button_option, text_size, widget
+        )
+        self._button_sizes[label] = size
+        return size
+
+
+class PersonListView(QListView):
+    """Non-scrolling list of people sized to its rows, with View/Remove actions."""
+    
+    # ------------------------------------------------------------------
+    # Constants
+    # ------------------------------------------------------------------
+    
+    # Keyboard equivalents of the painted buttons, applied to the current row
+    KEY_ACTIONS: dict[int, str] = {
+        Qt.Key.Key_Return: PersonRowDelegate.ACTION_VIEW,
+        Qt.Key.Key_Enter: PersonRowDelegate.ACTION_VIEW,
+        Qt.Key.Key_Space: PersonRowDelegate.ACTION_VIEW,
+        Qt.Key.Key_Delete: PersonRowDelegate.ACTION_REMOVE,
+    }
+    
+    # ------------------------------------------------------------------
+    # Signals
+    # ------------------------------------------------------------------
+    
+    viewRequested: Signal = Signal(int)  # person_id
+    removeRequested: Signal = Signal(object)  # Person
+    
+    # ------------------------------------------------------------------
+    # Initialization
+    # ------------------------------------------------------------------
+    
+    def __init__(
+        self,
+        display_format: Callable[[Person], str],
+        view_text: str,
+        remove_text: str | None = None,
+        parent: QWidget | None = None
+    ) -> None:
+        """Initialize the view with its model and painting delegate."""
+        super().__init__(parent)
+        
+        self.person_model: PersonListModel = PersonListModel(display_format, self)
+        self.setModel(self.person_model)
+        
+        self.row_delegate: PersonRowDelegate = PersonRowDelegate(view_text, remove_text, self)
+        self.setItemDelegate(self.row_delegate)
+        self.row_delegate.buttonClicked.connect(
+            self._on_button_clicked, Qt.ConnectionType.QueuedConnection
+        )
+        
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setFrameShape(QListView.Shape.NoFrame)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+    
+    # ------------------------------------------------------------------
+    # Public Interface
+    # ------------------------------------------------------------------
+    
+    def set_people(self, people: list[Person]) -> None:
+        """Show people and resize the view to fit every row."""
+        self.person_model.set_people(people)
+        self._fit_to_rows()
+    
+    # ------------------------------------------------------------------
+    # Interaction
+    # ------------------------------------------------------------------
+    
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        """Trigger the current row's View or Remove button from the keyboard."""
+        index: QModelIndex = self.currentIndex()
+        action: str | None = self.KEY_ACTIONS.get(event.key())
+        
+        if action is None or not index.isValid() or not self.row_delegate.has_action(action):
+            super().keyPressEvent(event)
+            return
+        
+        event.accept()
+        self._on_button_clicked(action, index.row())
+    
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    
+    def _fit_to_rows(self) -> None:
+        """Fix the view height to its rows so the enclosing scroll area scrolls instead."""
+        row_count: int = self.person_model.rowCount()
+        self.setVisible(row_count > 0)
+        if not row_count:
+            return
+        
+        row_height: int = self.sizeHintForRow(0)
+        self.setFixedHeight(row_height * row_count + 2 * self.frameWidth())
+    
+    def _on_button_clicked(self, action: str, row: int) -> None:
+        """Translate a delegate button click into a person-level signal."""
+        person: Person | None = self.person_model.person_at(row)
+        if person is None:
+            return
+        
+        if action == PersonRowDelegate.ACTION_REMOVE:
+            self.removeRequested.emit(person)
+        elif person.id is not None:
+            self.viewRequested.emit(person.id)
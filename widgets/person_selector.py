@@ -5,7 +5,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import QWidget, QLineEdit, QVBoxLayout, QCompleter
-from PySide6.QtCore import Signal, Qt, QStringListModel, QSortFilterProxyModel, QModelIndex, QPersistentModelIndex
+from PySide6.QtCore import (
+    Signal, Qt, QStringListModel, QSortFilterProxyModel, QModelIndex, QPersistentModelIndex, QObject
+)
 
 if TYPE_CHECKING:
     from database.db_manager import DatabaseManager
@@ -45,6 +47,15 @@ class AccentInsensitiveProxyModel(QSortFilterProxyModel):
         return normalized_filter in normalized_data
 
 
+class PersonNameModel(QStringListModel):
+    """Sorted person display names with their IDs, shareable between selectors."""
+    
+    def __init__(self, name_to_id: dict[str, int], parent: QObject | None = None) -> None:
+        """Initialize the model from a display name to person ID mapping."""
+        super().__init__(sorted(name_to_id), parent)
+        self.name_to_id: dict[str, int] = name_to_id
+
+
 class PersonSelector(QWidget):
     """Autocomplete text field for selecting a person from the database."""
     
@@ -84,13 +95,20 @@ class PersonSelector(QWidget):
     # Initialization
     # ------------------------------------------------------------------
     
-    def __init__(self, db_manager: DatabaseManager, parent: QWidget | None = None) -> None:
-        """Initialize the person selector widget."""
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        parent: QWidget | None = None,
+        people: list[Person] | None = None
+    ) -> None:
+        """Initialize the person selector widget, optionally from a preloaded person list."""
         super().__init__(parent)
         
         self.db_manager: DatabaseManager = db_manager
         self.person_repo: PersonRepository = PersonRepository(db_manager)
         
+        self._preloaded_people: list[Person] | None = people
+        self._shared_model: PersonNameModel | None = None
         self.gender_filter: str | None = None
         self._name_to_id: dict[str, int] = {}
         self._selected_person_id: int | None = None
@@ -154,10 +172,15 @@ class PersonSelector(QWidget):
         if not self.db_manager.is_open:
             return
         
-        all_people: list[Person] = self.person_repo.get_all()
+        all_people: list[Person] = (
+            self._preloaded_people
+            if self._preloaded_people is not None
+            else self.person_repo.get_all()
+        )
         filtered_people: list[Person] = self._apply_gender_filter(all_people)
         
-        self._name_to_id.clear()
+        self._shared_model = None
+        self._name_to_id = {}
         display_names: list[str] = self._build_display_names(filtered_people)
         display_names.sort()
         
@@ -196,29 +219,32 @@ class PersonSelector(QWidget):
     # Display Formatting
     # ------------------------------------------------------------------
     
-    def _format_person_display(self, person: Person) -> str:
+    @classmethod
+    def _format_person_display(cls, person: Person) -> str:
         """Format a person's info for display in the dropdown."""
         name: str = person.display_name
-        date_str: str = self._format_date_info(person)
+        date_str: str = cls._format_date_info(person)
         
-        return self.PERSON_DISPLAY_FORMAT.format(name=name, dates=date_str)
+        return cls.PERSON_DISPLAY_FORMAT.format(name=name, dates=date_str)
     
-    def _format_date_info(self, person: Person) -> str:
+    @classmethod
+    def _format_date_info(cls, person: Person) -> str:
         """Format date information for person display."""
         if person.death_year:
-            return self._format_lifespan(person)
+            return cls._format_lifespan(person)
         
         if person.birth_year:
-            return self.DATE_FORMAT_BIRTH_ONLY.format(year=person.birth_year)
+            return cls.DATE_FORMAT_BIRTH_ONLY.format(year=person.birth_year)
         
-        return self.DATE_FORMAT_UNKNOWN
+        return cls.DATE_FORMAT_UNKNOWN
     
-    def _format_lifespan(self, person: Person) -> str:
+    @classmethod
+    def _format_lifespan(cls, person: Person) -> str:
         """Format lifespan string for deceased person."""
-        birth: str = str(person.birth_year) if person.birth_year else self.DATE_PLACEHOLDER_UNKNOWN
+        birth: str = str(person.birth_year) if person.birth_year else cls.DATE_PLACEHOLDER_UNKNOWN
         death: str = str(person.death_year)
         
-        return self.DATE_FORMAT_LIFESPAN.format(birth=birth, death=death)
+        return cls.DATE_FORMAT_LIFESPAN.format(birth=birth, death=death)
     
     # ------------------------------------------------------------------
     # Event Handlers
@@ -266,6 +292,15 @@ class PersonSelector(QWidget):
         else:
             self.clear()
     
+    def set_person_object(self, person: Person) -> None:
+        """Set the selected person from an already loaded Person, skipping the ID lookup."""
+        if person.id is None:
+            self.clear()
+            return
+        
+        self.text_field.setText(self._format_person_display(person))
+        self._selected_person_id = person.id
+    
     def _find_display_name_for_id(self, person_id: int) -> str | None:
         """Find display name for a given person ID."""
         for display_name, pid in self._name_to_id.items():
@@ -282,11 +317,30 @@ class PersonSelector(QWidget):
     def refresh(self) -> None:
         """Reload people from database (call after adding/editing people)."""
         current_id: int | None = self._selected_person_id
+        self._preloaded_people = None
         self._load_people()
         
         if current_id is not None:
             self.set_person(current_id)
     
+    @classmethod
+    def build_name_model(cls, people: list[Person]) -> PersonNameModel:
+        """Build a name model once for several unfiltered selectors to share."""
+        return PersonNameModel({
+            cls._format_person_display(person): person.id
+            for person in people
+            if person.id is not None
+        })
+    
+    def set_shared_model(self, model: PersonNameModel) -> None:
+        """Complete from a shared name model instead of one built for this selector."""
+        if model is self._shared_model:
+            return
+        
+        self._shared_model = model
+        self._name_to_id = model.name_to_id
+        self.proxy_model.setSourceModel(model)
+    
     def set_filter(self, gender: str | None = None) -> None:
         """Filter the displayed people by gender."""
         self.gender_filter = gender